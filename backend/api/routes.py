@@ -1,17 +1,140 @@
 from flask import Blueprint, jsonify, request
 # Fix the import path
 from models.repository import Repository
+from models.organization import Organization
+from utils import deadline
+from utils.cache import cache
+from utils.circuit_breaker import CircuitOpenError
+from utils.executor import ExecutorBusyError, analysis_executor, bulk_executor, search_executor
+from utils.fields import parse_fields, project, subtree, wants
+from utils.github_api import RateLimitError
+from utils.job_queue import job_queue
+from utils.pagination import decode_cursor, paginate
+from utils.startup import startup
 import concurrent.futures
+import json
+from functools import partial
 from time import time
 
+# Upper bounds for organization rollup parameters
+MAX_ORG_REPOS = 500
+MAX_ORG_CONCURRENCY = 16
+
+# How long the last good result of each analysis section is kept as a fallback
+STALE_SECTION_EXPIRE_MINUTES = 24 * 60
+
+# Paginated lists of the commits section and their query parameter prefixes
+COMMIT_LIST_PARAMS = {
+    "author_contributions": "authors",
+    "daily_commits": "daily",
+}
+
 # Create blueprint for API routes
 api_blueprint = Blueprint('api', __name__, url_prefix='/api')
 
+def error_response(error, status):
+    """
+    Build a JSON error response.
+    
+    Errors caused by the GitHub rate limit, an open circuit breaker or a
+    full executor become a 503 with a Retry-After header, so clients back
+    off instead of retrying.
+    
+    Args:
+        error (Exception): Error to report
+        status (int): HTTP status for other errors
+    """
+    busy_error = deadline.find_cause(error, ExecutorBusyError)
+    if busy_error is not None:
+        return (
+            jsonify({"error": str(busy_error), "retry_after": busy_error.retry_after}),
+            503,
+            {"Retry-After": str(busy_error.retry_after)}
+        )
+    
+    retry_error = deadline.find_cause(error, CircuitOpenError) or deadline.find_cause(error, RateLimitError)
+    if retry_error is not None and retry_error.reset_time:
+        retry_after = max(1, int(retry_error.reset_time - time() + 0.999))
+        return jsonify({"error": str(error), "retry_after": retry_after}), 503, {"Retry-After": str(retry_after)}
+    return jsonify({"error": str(error)}), status
+
+def parse_timeout_ms(value):
+    """
+    Parse the ``timeout_ms`` of an analysis request.
+    
+    Args:
+        value: Value from the query string or JSON body, or None
+        
+    Returns:
+        int: Timeout in milliseconds, or None if not given
+        
+    Raises:
+        ValueError: If the value isn't a positive integer
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        raise ValueError("timeout_ms must be a positive integer")
+    try:
+        timeout_ms = int(value)
+    except (TypeError, ValueError):
+        raise ValueError("timeout_ms must be a positive integer")
+    if timeout_ms <= 0:
+        raise ValueError("timeout_ms must be a positive integer")
+    return timeout_ms
+
+def validate_cursors(args):
+    """Raise ValueError if a pagination cursor in the query string is malformed."""
+    for prefix in COMMIT_LIST_PARAMS.values():
+        decode_cursor(args.get(f'{prefix}_cursor'))
+
+def select_cursor_fields(commit_fields):
+    """Keep the next-page cursor of each selected commit list in a commits field tree."""
+    if isinstance(commit_fields, dict):
+        for key in COMMIT_LIST_PARAMS:
+            if key in commit_fields:
+                commit_fields[f"{key}_next_cursor"] = True
+    return commit_fields
+
+def paginate_commits(commits, args):
+    """
+    Apply cursor pagination to the author and daily lists of a commits section.
+    
+    Each list is paginated with ``authors_limit``/``authors_cursor`` or
+    ``daily_limit``/``daily_cursor``. The cursor for the next page is returned
+    next to the list, e.g. ``author_contributions_next_cursor``.
+    """
+    for key, prefix in COMMIT_LIST_PARAMS.items():
+        limit = args.get(f'{prefix}_limit', type=int)
+        cursor = args.get(f'{prefix}_cursor')
+        if key in commits and (limit is not None or cursor):
+            commits[key], commits[f"{key}_next_cursor"] = paginate(commits[key], cursor, limit)
+    return commits
+
 @api_blueprint.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint to verify API is running."""
     return jsonify({"status": "ok", "message": "API is running"})
 
+@api_blueprint.route('/ready', methods=['GET'])
+def readiness_check():
+    """Readiness endpoint, returns 503 until startup has finished."""
+    startup.start()
+    status = startup.status()
+    if status["status"] != "ready":
+        return jsonify(status), 503
+    return jsonify(status)
+
+@api_blueprint.route('/metrics', methods=['GET'])
+def executor_metrics():
+    """Utilization and queue wait statistics of the shared executors."""
+    return jsonify({
+        "executors": {
+            executor.name: executor.stats()
+            for executor in (analysis_executor, bulk_executor, search_executor)
+        }
+    })
+
 @api_blueprint.route('/repository/<path:repo_name>', methods=['GET'])
 def get_repository(repo_name):
     """
@@ -25,7 +148,7 @@ def get_repository(repo_name):
         data = repo.fetch_data()
         return jsonify(data)
     except Exception as e:
-        return jsonify({"error": str(e)}), 404
+        return error_response(e, 404)
 
 @api_blueprint.route('/repository/<path:repo_name>/commits', methods=['GET'])
 def get_commit_analysis(repo_name):
@@ -37,11 +160,21 @@ def get_commit_analysis(repo_name):
     """
     try:
         days = request.args.get('days', default=30, type=int)
+        fields = select_cursor_fields(parse_fields(request.args.get('fields')))
+        try:
+            validate_cursors(request.args)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
         repo = Repository(repo_name)
-        data = repo.get_commit_trends(days=days)
-        return jsonify(data)
+        data = repo.get_commit_trends(
+            days=days,
+            include_daily=wants(fields, 'daily_commits'),
+            include_authors=wants(fields, 'author_contributions')
+        )
+        return jsonify(project(paginate_commits(data, request.args), fields))
     except Exception as e:
-        return jsonify({"error": str(e)}), 404
+        return error_response(e, 404)
 
 @api_blueprint.route('/repository/<path:repo_name>/issues', methods=['GET'])
 def get_issue_analysis(repo_name):
@@ -56,7 +189,7 @@ def get_issue_analysis(repo_name):
         data = repo.get_issue_metrics()
         return jsonify(data)
     except Exception as e:
-        return jsonify({"error": str(e)}), 404
+        return error_response(e, 404)
 
 @api_blueprint.route('/repository/<path:repo_name>/languages', methods=['GET'])
 def get_language_analysis(repo_name):
@@ -71,7 +204,30 @@ def get_language_analysis(repo_name):
         data = repo.get_language_analysis()
         return jsonify(data)
     except Exception as e:
-        return jsonify({"error": str(e)}), 404
+        return error_response(e, 404)
+
+@api_blueprint.route('/org/<owner>', methods=['GET'])
+def get_organization_rollup(owner):
+    """
+    Get languages, top contributors and commit activity aggregated across an owner's repositories.
+    
+    Args:
+        owner (str): User or organization login
+    """
+    try:
+        max_repos = request.args.get('max_repos', default=50, type=int)
+        days = request.args.get('days', default=30, type=int)
+        concurrency = request.args.get('concurrency', default=None, type=int)
+        
+        org = Organization(owner)
+        data = org.get_rollup(
+            max_repos=min(max(1, max_repos), MAX_ORG_REPOS),
+            days=days,
+            max_workers=min(max(1, concurrency), MAX_ORG_CONCURRENCY) if concurrency else None
+        )
+        return jsonify(data)
+    except Exception as e:
+        return error_response(e, 404)
 
 @api_blueprint.route('/analyze', methods=['POST'])
 def analyze_repository():
@@ -80,8 +236,22 @@ def analyze_repository():
     
     Expected request body:
     {
-        "repo_name": "owner/repo"
+        "repo_name": "owner/repo",
+        "timeout_ms": 5000,  (optional, also accepted as ?timeout_ms=)
+        "fields": "commits.total_commits,languages"  (optional, also accepted as ?fields=)
     }
+    
+    With a timeout, the deadline applies to every GitHub call the sections
+    make. Sections that aren't done by the deadline are returned as
+    "timeout" and the rest of the result is returned right away. Without a
+    timeout there is no deadline. Sections that timed out or failed fall
+    back to the last good result, if there is one.
+    
+    With fields, only the selected sections are computed and only the
+    selected fields are returned. The overview embeds commit activity only
+    if ``overview.commit_activity`` is selected. The commit author and daily
+    lists can be paginated with ``authors_limit``/``authors_cursor`` and
+    ``daily_limit``/``daily_cursor``.
     """
     try:
         start_time = time()
@@ -91,32 +261,144 @@ def analyze_repository():
             return jsonify({"error": "Repository name is required"}), 400
         
         repo_name = data['repo_name']
+        fields = parse_fields(request.args.get('fields') or data.get('fields'))
+        if fields:
+            select_cursor_fields(fields.get("commits"))
+        try:
+            timeout_ms = parse_timeout_ms(request.args.get('timeout_ms', data.get('timeout_ms')))
+            validate_cursors(request.args)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
         repo = Repository(repo_name)
         
-        # Create a ThreadPoolExecutor to fetch data in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-            # Submit all the analysis tasks
-            overview_future = executor.submit(repo.fetch_data)
-            commits_future = executor.submit(repo.get_commit_trends)
-            issues_future = executor.submit(repo.get_issue_metrics)
-            languages_future = executor.submit(repo.get_language_analysis)
+        # Only the sections that were asked for are computed
+        sections = {
+            "overview": partial(
+                repo.fetch_data,
+                include_commit_activity=wants(fields, 'overview', 'commit_activity')
+            ),
+            "commits": partial(
+                repo.get_commit_trends,
+                include_daily=wants(fields, 'commits', 'daily_commits'),
+                include_authors=wants(fields, 'commits', 'author_contributions')
+            ),
+            "issues": repo.get_issue_metrics,
+            "languages": repo.get_language_analysis,
+        }
+        sections = {name: method for name, method in sections.items() if wants(fields, name)}
+        
+        with deadline.deadline_scope(timeout_ms):
+            # Fetch the sections in parallel on the shared executor, each one bound by the
+            # request deadline. If the executor is full the request is rejected up front.
+            futures = analysis_executor.submit_all(sections)
+            concurrent.futures.wait(futures.values(), timeout=deadline.remaining())
+        
+        result = {}
+        section_status = {}
+        stale_sections = []
+        errors = {}
+        for name, future in futures.items():
+            stale_key = cache.generate_key(
+                'analysis_section', repo_name, section=name,
+                fields=json.dumps(subtree(fields, name), sort_keys=True)
+            )
+            
+            if future.done() and future.exception() is None:
+                result[name] = future.result()
+                if not result[name].get("is_partial"):
+                    section_status[name] = "done"
+                    cache.set(stale_key, result[name], STALE_SECTION_EXPIRE_MINUTES)
+                    continue
+                
+                # A partial section (e.g. issue counts still filling the search budget)
+                # neither replaces nor beats the last complete result
+                section_status[name] = "partial"
+                stale = cache.get(stale_key)
+                if stale is not None:
+                    result[name] = stale
+                    stale_sections.append(name)
+                continue
             
-            # Get all results - this will block until all are complete
-            # If any task raises an exception, it will be raised when the result is accessed
-            overview = overview_future.result()
-            commits = commits_future.result()
-            issues = issues_future.result()
-            languages = languages_future.result()
-        
-        # Combine all data
-        result = {
-            "overview": overview,
-            "commits": commits,
-            "issues": issues,
-            "languages": languages,
+            if not future.done() or deadline.find_cause(future.exception(), deadline.DeadlineExceeded):
+                # A section still running stops at its next deadline check
+                section_status[name] = "timeout"
+                errors[name] = "Section did not finish before the deadline"
+            else:
+                section_status[name] = "error"
+                errors[name] = str(future.exception())
+            
+            result[name] = cache.get(stale_key)
+            if result[name] is not None:
+                stale_sections.append(name)
+        
+        # Nothing to return at all, e.g. the repository doesn't exist
+        if errors and len(errors) == len(sections) and not stale_sections:
+            failed = [name for name, status in section_status.items() if status == "error"]
+            if not failed:
+                return jsonify({"error": "Analysis did not finish before the deadline", "errors": errors}), 504
+            return error_response(futures[failed[0]].exception(), 500)
+        
+        if result.get("commits"):
+            result["commits"] = paginate_commits(dict(result["commits"]), request.args)
+        for name in sections:
+            result[name] = project(result[name], subtree(fields, name))
+        
+        result.update({
+            "sections": section_status,
+            "stale_sections": stale_sections,
+            "errors": errors,
+            "is_partial": any(status != "done" for status in section_status.values()),
             "analysis_time": round(time() - start_time, 2)  # Add analysis time for tracking
-        }
+        })
         
         return jsonify(result)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
\ No newline at end of file
+        return error_response(e, 500)
+
+@api_blueprint.route('/jobs', methods=['POST'])
+def create_analysis_job():
+    """
+    Enqueue a repository analysis to run in the background.
+    
+    Expected request body:
+    {
+        "repo_name": "owner/repo"
+    }
+    """
+    try:
+        data = request.get_json()
+        
+        if not data or 'repo_name' not in data:
+            return jsonify({"error": "Repository name is required"}), 400
+        
+        job_queue.start()
+        job_id = job_queue.enqueue(data['repo_name'])
+        job = job_queue.get(job_id)
+        
+        return jsonify({
+            "job_id": job_id,
+            "status": job["status"],
+            "status_url": f"/api/jobs/{job_id}"
+        }), 202
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@api_blueprint.route('/jobs/<job_id>', methods=['GET'])
+def get_analysis_job(job_id):
+    """
+    Get the status, per-section progress and result of an analysis job.
+    
+    Args:
+        job_id (str): Job id returned by POST /api/jobs
+    """
+    try:
+        job_queue.start()
+        job = job_queue.get(job_id)
+        
+        if job is None:
+            return jsonify({"error": "Job not found"}), 404
+        
+        return jsonify(job)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
@@ -22,6 +22,14 @@ def create_app(config_name='default'):
     from api.routes import api_blueprint
     app.register_blueprint(api_blueprint)
     
+    # Start cache, GitHub client and job workers in the background;
+    # /api/ready reports when they are done
+    from utils.startup import startup
+    # Under the debug reloader, the parent process only watches for file changes;
+    # job workers run in the child that serves requests (WERKZEUG_RUN_MAIN=true)
+    reloader_parent = app.debug and os.environ.get('WERKZEUG_RUN_MAIN') != 'true'
+    startup.start(start_jobs=app.config['START_JOB_WORKERS'] and not reloader_parent)
+    
     # Root route to serve the HTML template
     @app.route('/')
     def index():
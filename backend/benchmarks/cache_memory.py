@@ -0,0 +1,123 @@
+"""
+Memory benchmark for cached commit data.
+
+Compares bytes per cached repository for the list-of-dicts layout the
+commit path used before and the columnar layout it uses now, on synthetic
+commit history. Run from the backend directory:
+
+    python -m benchmarks.cache_memory
+"""
+import json
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from utils.columnar import CommitColumns
+from utils.commit_rollup import CommitRollup
+
+
+def deep_sizeof(obj, seen=None):
+    """Approximate the memory held by an object and everything it references."""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    return size
+
+
+def synthetic_commits(num_commits, num_authors, days, seed=0):
+    """Generate (timestamp, author, sha, message) tuples with a skewed author distribution."""
+    rng = random.Random(seed)
+    end = datetime(2024, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+    authors = [f"contributor-{index}" for index in range(num_authors)]
+    weights = [1 / (rank + 1) for rank in range(num_authors)]
+    commits = []
+    for _ in range(num_commits):
+        when = end - timedelta(seconds=rng.randrange(days * 86400))
+        author = rng.choices(authors, weights)[0]
+        sha = "%040x" % rng.getrandbits(160)
+        message = "Fix " + " ".join(rng.choice(["parser", "cache", "tests", "docs", "api"]) for _ in range(8))
+        commits.append((when.timestamp(), author, sha, message))
+    return commits, end.date() - timedelta(days=days - 1), end.date()
+
+
+def counts_by_day(records):
+    """Group (date, author) pairs into the per-day counts the rollup is built from."""
+    daily_counts = {}
+    author_daily_counts = {}
+    for day, author in records:
+        daily_counts[day] = daily_counts.get(day, 0) + 1
+        author_counts = author_daily_counts.setdefault(author, {})
+        author_counts[day] = author_counts.get(day, 0) + 1
+    return daily_counts, author_daily_counts
+
+
+def dense_rollup_dict(start_date, num_days, daily_counts, author_daily_counts):
+    """Rollup layout with a dense prefix sum list per author, as cached before."""
+    def prefix(counts):
+        values = [0] * (num_days + 1)
+        for offset in range(num_days):
+            values[offset + 1] = values[offset] + counts.get(start_date + timedelta(days=offset), 0)
+        return values
+
+    return {
+        "start_date": start_date.isoformat(),
+        "daily_prefix": prefix(daily_counts),
+        "author_prefix": {author: prefix(counts) for author, counts in author_daily_counts.items()},
+    }
+
+
+def report(label, obj, serialized):
+    print(f"  {label:<32} {deep_sizeof(obj):>12,} bytes in memory  {len(serialized):>12,} bytes serialized")
+
+
+def main(num_commits=20000, num_authors=500, days=365):
+    commits, start_date, end_date = synthetic_commits(num_commits, num_authors, days)
+    print(f"{num_commits:,} commits, {num_authors} authors, {days} days")
+
+    # Commit records held while aggregating
+    print("Commit records")
+    records = [
+        {
+            "sha": sha,
+            "author": author,
+            "date": datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat(),
+            "message": message,
+        }
+        for timestamp, author, sha, message in commits
+    ]
+    report("list of dicts (before)", records, json.dumps(records))
+
+    columns = CommitColumns()
+    for timestamp, author, _, _ in commits:
+        columns.append(timestamp, author)
+    column_size = (
+        sys.getsizeof(columns.timestamps) + sys.getsizeof(columns.author_ids) + deep_sizeof(columns.authors)
+    )
+    print(f"  {'columnar (after)':<32} {column_size:>12,} bytes in memory")
+
+    # Cached rollup per repository
+    print("Cached rollup per repository")
+    daily_counts, author_daily_counts = counts_by_day(
+        (datetime.fromtimestamp(timestamp, tz=timezone.utc).date(), author)
+        for timestamp, author, _, _ in commits
+    )
+    dense = dense_rollup_dict(start_date, days, daily_counts, author_daily_counts)
+    report("dense prefix lists (before)", dense, json.dumps(dense))
+
+    compact = CommitRollup.from_counts(start_date, end_date, daily_counts, author_daily_counts).to_dict()
+    report("columnar, encoded (after)", compact, json.dumps(compact))
+
+    # Both layouts must answer windows identically
+    restored = CommitRollup.from_dict(compact)
+    assert restored.window(days)["total_commits"] == num_commits
+
+
+if __name__ == '__main__':
+    main()
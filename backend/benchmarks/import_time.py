@@ -0,0 +1,71 @@
+"""
+Startup cost benchmark.
+
+Measures, in fresh interpreters, how long it takes to import the app and
+build it with ``create_app``, which is what a cold worker pays before it can
+answer ``/api/health``. Also lists the slowest imports reported by
+``python -X importtime``. Run from the backend directory:
+
+    python -m benchmarks.import_time
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The background startup step is disabled, so the benchmark makes no GitHub
+# call with the token from .env and starts no job workers
+CREATE_APP = (
+    "from utils.startup import startup; startup.start = lambda **kwargs: None; "
+    "from app import create_app; create_app('production')"
+)
+
+
+def time_startup(runs=5):
+    """Wall time in seconds of each cold interpreter run that creates the app."""
+    timings = []
+    script = (
+        "import time; start = time.perf_counter(); "
+        f"{CREATE_APP}; "
+        "print(time.perf_counter() - start)"
+    )
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+    return timings
+
+
+def slowest_imports(limit=15):
+    """Modules with the largest cumulative import time, as (microseconds, module)."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CREATE_APP],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    ).stderr
+
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        imports.append((int(cumulative), module.strip()))
+    return sorted(imports, reverse=True)[:limit]
+
+
+def main(runs=5):
+    timings = time_startup(runs)
+    print(f"create_app cold start over {runs} runs: "
+          f"median {statistics.median(timings) * 1000:.0f} ms, "
+          f"min {min(timings) * 1000:.0f} ms, max {max(timings) * 1000:.0f} ms")
+
+    print("Slowest imports (cumulative):")
+    for cumulative, module in slowest_imports():
+        print(f"  {cumulative / 1000:>8.1f} ms  {module}")
+
+
+if __name__ == '__main__':
+    main()
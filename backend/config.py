@@ -8,6 +8,8 @@ class Config:
     """Base configuration."""
     SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-key-please-change')
     GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN')
+    # Disabled when the app is preloaded in a server's master process
+    START_JOB_WORKERS = os.environ.get('START_JOB_WORKERS', 'true').lower() in ('true', '1', 't')
     DEBUG = False
     TESTING = False
     
@@ -0,0 +1,42 @@
+import multiprocessing
+import os
+
+# Gunicorn settings for the production entry point (`gunicorn -c gunicorn.conf.py wsgi:app`)
+
+bind = os.environ.get('BIND', '0.0.0.0:5000')
+
+# Number of worker processes, defaults to one per CPU core
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+threads = int(os.environ.get('WORKER_THREADS', 4))
+
+# Load the application once in the master and fork workers from it
+preload_app = True
+
+# Give in-flight analyses time to finish on reload (HUP) or shutdown (TERM)
+timeout = int(os.environ.get('WORKER_TIMEOUT', 120))
+graceful_timeout = int(os.environ.get('GRACEFUL_TIMEOUT', 30))
+
+# Recycle workers periodically to bound memory growth
+max_requests = int(os.environ.get('MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('MAX_REQUESTS_JITTER', 100))
+
+# Share one cache across all workers on this host unless configured otherwise
+os.environ.setdefault('CACHE_BACKEND', 'shared')
+
+# Job workers run in the forked workers only, not in the master
+os.environ['START_JOB_WORKERS'] = 'false'
+
+
+def pre_fork(server, worker):
+    """Finish startup in the master so workers are forked warm."""
+    from utils.startup import startup
+    startup.wait(timeout=graceful_timeout)
+
+
+def post_fork(server, worker):
+    """Redo the per-process startup steps, such as the job workers, in each worker."""
+    from utils.github_api import GitHubAnalyzer
+    from utils.startup import startup
+    # The inherited client holds the master's keep-alive connections; build one per worker
+    GitHubAnalyzer.clear_clients()
+    startup.start(start_jobs=True)
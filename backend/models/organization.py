@@ -0,0 +1,183 @@
+import concurrent.futures
+import os
+from time import time
+# Fix the import path
+from utils.circuit_breaker import CircuitOpenError
+from utils.executor import ExecutorBusyError, bulk_executor
+from utils.github_api import GitHubAnalyzer, RateLimitError
+
+# Contributors fetched per repository (one page). Repositories with more are
+# ranked from their top contributors only, which makes the rollup approximate.
+CONTRIBUTORS_PER_REPOSITORY = 100
+
+
+class Organization:
+    """Organization model class for analyzing all repositories of an owner."""
+
+    def __init__(self, owner):
+        """
+        Initialize an organization model.
+
+        Args:
+            owner (str): User or organization login
+        """
+        self.owner = owner
+        self.analyzer = GitHubAnalyzer()
+
+    def _analyze_repository(self, repo_name, days):
+        """
+        Fetch the sections needed for the rollup of a single repository.
+
+        Each section comes from the analyzer's per-repository cache when available.
+        """
+        return {
+            "languages": self.analyzer.get_languages(repo_name),
+            "contributors": self.analyzer.get_contributors(repo_name, limit=CONTRIBUTORS_PER_REPOSITORY),
+            "commit_activity": self.analyzer.get_commit_activity(repo_name, days=days),
+        }
+
+    def get_rollup(self, max_repos=50, days=30, max_workers=None, top_contributors=10):
+        """
+        Aggregate languages, contributors and commit activity across repositories.
+
+        Repositories are fetched concurrently on the shared bulk executor and
+        merged as each one finishes. Repositories that fail are reported and
+        left out; if the rate limit is hit, GitHub calls are paused by the
+        circuit breaker, or the bulk executor stays full, the remaining
+        repositories are skipped and the partial rollup is returned.
+
+        Top contributors are merged from each repository's first
+        CONTRIBUTORS_PER_REPOSITORY contributors; ``top_contributors_complete``
+        says whether that covered every contributor.
+
+        Args:
+            max_repos (int): Maximum number of repositories to include
+            days (int): Number of days of commit activity
+            max_workers (int): Maximum number of repositories fetched at once
+            top_contributors (int): Number of contributors to return
+
+        Returns:
+            dict: Organization rollup data
+        """
+        start_time = time()
+        if max_workers is None:
+            max_workers = int(os.environ.get('ORG_MAX_WORKERS', 8))
+
+        repo_names = self.analyzer.get_owner_repositories(self.owner, limit=max_repos)
+
+        language_bytes = {}
+        contributions = {}
+        contributors_complete = True
+        daily_commits = {}
+        total_commits = 0
+        analyzed = []
+        failed = []
+        skipped = []
+
+        max_workers = max(1, max_workers)
+        queued = list(repo_names)
+        in_flight = {}
+        stopped = False
+
+        while queued or in_flight:
+            # Keep up to max_workers repositories in flight on the shared bulk executor
+            while queued and not stopped and len(in_flight) < max_workers:
+                try:
+                    future = bulk_executor.submit(self._analyze_repository, queued[0], days)
+                except ExecutorBusyError:
+                    if in_flight:
+                        # Wait for one of our own repositories to make room
+                        break
+                    if not (analyzed or failed):
+                        raise
+                    # Return what we have rather than waiting on other requests' work
+                    stopped = True
+                    break
+                in_flight[future] = queued.pop(0)
+
+            if stopped:
+                skipped.extend(queued)
+                queued = []
+            if not in_flight:
+                break
+
+            # Merge each repository into the totals as soon as it finishes
+            done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                repo_name = in_flight.pop(future)
+                try:
+                    data = future.result()
+                except (RateLimitError, CircuitOpenError) as e:
+                    failed.append({"repository": repo_name, "error": str(e)})
+                    stopped = True
+                    continue
+                except Exception as e:
+                    failed.append({"repository": repo_name, "error": str(e)})
+                    continue
+
+                for lang in data["languages"].get("languages", []):
+                    language_bytes[lang["language"]] = language_bytes.get(lang["language"], 0) + lang["bytes"]
+
+                if len(data["contributors"]) >= CONTRIBUTORS_PER_REPOSITORY:
+                    contributors_complete = False
+                for contributor in data["contributors"]:
+                    login = contributor["login"]
+                    if login not in contributions:
+                        contributions[login] = {
+                            "login": login,
+                            "avatar_url": contributor["avatar_url"],
+                            "url": contributor["url"],
+                            "contributions": 0,
+                            "repositories": 0,
+                        }
+                    contributions[login]["contributions"] += contributor["contributions"]
+                    contributions[login]["repositories"] += 1
+
+                commit_activity = data["commit_activity"]
+                total_commits += commit_activity["total_commits"]
+                for day_data in commit_activity.get("daily_commits", []):
+                    day = str(day_data["date"])
+                    daily_commits[day] = daily_commits.get(day, 0) + day_data["count"]
+
+                analyzed.append(repo_name)
+
+        total_bytes = sum(language_bytes.values())
+        languages = sorted(
+            (
+                {
+                    "language": lang,
+                    "bytes": bytes_count,
+                    "percentage": round(bytes_count / total_bytes * 100, 2) if total_bytes > 0 else 0
+                }
+                for lang, bytes_count in language_bytes.items()
+            ),
+            key=lambda x: x["bytes"],
+            reverse=True
+        )
+
+        contributors = sorted(contributions.values(), key=lambda x: x["contributions"], reverse=True)
+
+        return {
+            "owner": self.owner,
+            "repositories": len(repo_names),
+            "analyzed_repositories": analyzed,
+            "failed_repositories": failed,
+            "skipped_repositories": skipped,
+            "is_partial": bool(failed or skipped),
+            "languages": {
+                "total_bytes": total_bytes,
+                "languages": languages
+            },
+            "top_contributors": contributors[:top_contributors],
+            # False if a repository had more contributors than were fetched, in which
+            # case someone ranked below the cut-off in every repository can be missed
+            "top_contributors_complete": contributors_complete,
+            "commits": {
+                "days": days,
+                "total_commits": total_commits,
+                "daily_commits": [
+                    {"date": day, "count": count} for day, count in sorted(daily_commits.items())
+                ]
+            },
+            "analysis_time": round(time() - start_time, 2)
+        }
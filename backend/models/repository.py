@@ -18,15 +18,20 @@ class Repository:
         self.analyzer = GitHubAnalyzer()
         self.data = None
     
-    def fetch_data(self):
+    def fetch_data(self, include_commit_activity=True):
         """
         Fetch all repository data from GitHub API.
         
+        Args:
+            include_commit_activity (bool): Whether to embed the last 30 days of commit activity
+        
         Returns:
             dict: Repository data
         """
         try:
-            self.data = self.analyzer.get_repository_overview(self.repo_name)
+            self.data = self.analyzer.get_repository_overview(
+                self.repo_name, include_commit_activity=include_commit_activity
+            )
             return self.data
         except Exception as e:
             raise Exception(f"Error fetching repository data: {e}")
@@ -53,23 +58,30 @@ class Repository:
                 "open_issues": open_issues,
                 "closed_issues": closed_issues,
                 "total_issues": total_issues,
-                "resolution_rate": round(resolution_rate, 2)
+                "resolution_rate": round(resolution_rate, 2),
+                "weekly_activity": issues_data.get("weekly", []),
+                "resolution_time": issues_data.get("resolution_time"),
+                "is_partial": issues_data.get("is_partial", False)
             }
         except Exception as e:
             raise Exception(f"Error calculating issue metrics: {e}")
     
-    def get_commit_trends(self, days=30):
+    def get_commit_trends(self, days=30, include_daily=True, include_authors=True):
         """
         Get commit trend analysis.
         
         Args:
             days (int): Number of days to analyze
+            include_daily (bool): Whether to compute the daily commit counts
+            include_authors (bool): Whether to compute the author contributions
             
         Returns:
             dict: Commit trend data
         """
         try:
-            commit_data = self.analyzer.get_commit_activity(self.repo_name, days=days)
+            commit_data = self.analyzer.get_commit_activity(
+                self.repo_name, days=days, include_daily=include_daily, include_authors=include_authors
+            )
             
             # Extract commit counts by day
             daily_counts = []
@@ -85,12 +97,15 @@ class Repository:
             # Calculate average commits per day
             avg_commits_per_day = commit_data["total_commits"] / days if days > 0 else 0
             
-            return {
+            result = {
                 "total_commits": commit_data["total_commits"],
-                "daily_commits": daily_counts,
-                "author_contributions": author_data,
                 "avg_commits_per_day": round(avg_commits_per_day, 2)
             }
+            if include_daily:
+                result["daily_commits"] = daily_counts
+            if include_authors:
+                result["author_contributions"] = author_data
+            return result
         except Exception as e:
             raise Exception(f"Error analyzing commit trends: {e}")
     
@@ -0,0 +1,87 @@
+import pytest
+
+from utils import circuit_breaker
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(circuit_breaker, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker("core", failure_threshold=3, window_seconds=60, cooldown_seconds=30)
+
+
+def test_opens_after_failure_storm(breaker):
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.before_call()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_call()
+    assert error.value.retry_after == 30
+
+
+def test_failures_outside_the_window_are_forgotten(breaker, clock):
+    breaker.record_failure()
+    breaker.record_failure()
+    clock[0] += 61
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+
+def test_trial_call_success_closes_the_circuit(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure()
+    clock[0] += 30
+    assert breaker.state == "half_open"
+
+    breaker.before_call()
+    # Only one trial call at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.before_call()
+
+
+def test_trial_call_failure_reopens_the_circuit(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure()
+    clock[0] += 30
+    breaker.before_call()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_released_trial_lets_another_call_through(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure()
+    clock[0] += 30
+    breaker.before_call()
+
+    breaker.release_trial()
+    assert breaker.state == "half_open"
+    breaker.before_call()
+
+
+def test_rate_limit_opens_until_reset(breaker, clock):
+    breaker.record_rate_limited(clock[0] + 120)
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_call()
+    assert error.value.reset_time == clock[0] + 120
+
+    clock[0] += 120
+    assert breaker.state == "half_open"
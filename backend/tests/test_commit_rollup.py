@@ -0,0 +1,102 @@
+import json
+from datetime import date, timedelta
+
+from utils.commit_rollup import CommitRollup
+
+TODAY = date(2024, 3, 31)
+
+
+def days_ago(days):
+    return TODAY - timedelta(days=days)
+
+
+def make_rollup(start, end, daily_counts, author_daily_counts, **kwargs):
+    return CommitRollup.from_counts(start, end, daily_counts, author_daily_counts, **kwargs)
+
+
+def test_window_slices_daily_and_author_counts():
+    rollup = make_rollup(
+        days_ago(9), TODAY,
+        {days_ago(8): 2, days_ago(3): 1, TODAY: 4},
+        {"alice": {days_ago(8): 2, TODAY: 3}, "bob": {days_ago(3): 1, TODAY: 1}},
+    )
+
+    assert rollup.covers(9, TODAY)
+    assert not rollup.covers(10, TODAY)
+    assert not rollup.covers(5, TODAY + timedelta(days=1))
+
+    window = rollup.window(5)
+    assert window["total_commits"] == 5
+    assert window["daily_commits"] == [
+        {"date": days_ago(3).isoformat(), "count": 1},
+        {"date": TODAY.isoformat(), "count": 4},
+    ]
+    assert window["authors"] == [{"author": "alice", "count": 3}, {"author": "bob", "count": 2}]
+
+    window = rollup.window(9, include_daily=False, include_authors=False)
+    assert window == {"total_commits": 7, "is_sampled": False, "sampling_factor": 1}
+
+
+def test_exact_total_is_used_for_the_full_range():
+    rollup = make_rollup(
+        days_ago(9), TODAY, {days_ago(3): 10, TODAY: 10}, {},
+        is_sampled=True, sampling_factor=5, total_commits=23,
+    )
+    assert rollup.window(30)["total_commits"] == 23
+    assert rollup.window(5)["total_commits"] == 20
+
+
+def test_extend_back_prepends_an_older_range():
+    newer = make_rollup(
+        days_ago(4), TODAY, {days_ago(2): 3}, {"alice": {days_ago(2): 2}, "bob": {days_ago(2): 1}},
+        total_commits=3,
+    )
+    older = make_rollup(
+        days_ago(9), days_ago(5), {days_ago(7): 4}, {"alice": {days_ago(7): 4}},
+        is_sampled=True, sampling_factor=2, total_commits=4,
+    )
+    newer.extend_back(older)
+
+    assert newer.start_date == days_ago(9)
+    assert newer.is_sampled and newer.sampling_factor == 2
+    window = newer.window(9)
+    assert window["total_commits"] == 7
+    assert window["authors"] == [{"author": "alice", "count": 6}, {"author": "bob", "count": 1}]
+    assert newer.window(4)["authors"] == [{"author": "alice", "count": 2}, {"author": "bob", "count": 1}]
+
+
+def test_extend_back_requires_adjacent_ranges():
+    newer = make_rollup(days_ago(4), TODAY, {}, {})
+    older = make_rollup(days_ago(9), days_ago(6), {}, {})
+    try:
+        newer.extend_back(older)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected a ValueError for a gap between the ranges")
+
+
+def test_extend_back_drops_unknown_exact_total():
+    newer = make_rollup(days_ago(4), TODAY, {TODAY: 1}, {}, total_commits=1)
+    newer.extend_back(make_rollup(days_ago(9), days_ago(5), {days_ago(5): 1}, {}))
+    assert newer.total_commits is None
+    assert newer.window(9)["total_commits"] == 2
+
+
+def test_round_trips_through_json():
+    rollup = make_rollup(
+        days_ago(9), TODAY, {days_ago(8): 2, TODAY: 4}, {"alice": {days_ago(8): 2, TODAY: 4}},
+        is_sampled=True, sampling_factor=3, total_commits=7,
+    )
+    restored = CommitRollup.from_dict(json.loads(json.dumps(rollup.to_dict())))
+
+    assert restored.start_date == rollup.start_date and restored.end_date == rollup.end_date
+    assert restored.fetched_at == rollup.fetched_at
+    for days in (1, 5, 9):
+        assert restored.window(days) == rollup.window(days)
+
+
+def test_older_layouts_are_ignored():
+    data = make_rollup(days_ago(1), TODAY, {}, {}).to_dict()
+    data["version"] = CommitRollup.VERSION - 1
+    assert CommitRollup.from_dict(data) is None
@@ -0,0 +1,71 @@
+import threading
+
+import pytest
+
+from utils import deadline
+from utils.executor import BoundedExecutor, ExecutorBusyError
+
+
+@pytest.fixture
+def gate():
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def test_rejects_work_beyond_capacity(gate):
+    executor = BoundedExecutor("test", max_workers=1, queue_size=1)
+    executor.submit(gate.wait)
+    executor.submit(gate.wait)
+
+    with pytest.raises(ExecutorBusyError) as error:
+        executor.submit(gate.wait)
+    assert error.value.retry_after >= 1
+    assert executor.stats()["rejected"] == 1
+
+
+def test_submit_all_admits_all_or_none(gate):
+    executor = BoundedExecutor("test", max_workers=1, queue_size=1)
+    executor.submit(gate.wait)
+
+    with pytest.raises(ExecutorBusyError):
+        executor.submit_all({"a": gate.wait, "b": gate.wait})
+    assert executor.stats()["submitted"] == 1
+
+    futures = executor.submit_all({"a": lambda: "a"})
+    gate.set()
+    assert futures["a"].result(timeout=5) == "a"
+
+
+def test_slots_are_freed_when_tasks_finish():
+    executor = BoundedExecutor("test", max_workers=2, queue_size=0)
+    futures = executor.submit_all({"a": lambda: 1, "b": lambda: 2})
+    assert [future.result(timeout=5) for future in futures.values()] == [1, 2]
+
+    futures = executor.submit_all({"a": lambda: 3, "b": lambda: 4})
+    assert [future.result(timeout=5) for future in futures.values()] == [3, 4]
+    assert executor.stats()["completed"] == 4
+
+
+def test_cancelled_tasks_free_their_slots(gate):
+    executor = BoundedExecutor("test", max_workers=1, queue_size=2)
+    running = executor.submit(gate.wait)
+    queued = executor.submit_all({"a": lambda: 1, "b": lambda: 2})
+
+    assert all(future.cancel() for future in queued.values())
+    assert executor.stats()["queued"] == 0
+
+    # The cancelled tasks no longer count against the queue
+    more = executor.submit_all({"c": lambda: 3, "d": lambda: 4})
+    gate.set()
+    running.result(timeout=5)
+    assert [future.result(timeout=5) for future in more.values()] == [3, 4]
+
+
+def test_tasks_inherit_the_request_deadline():
+    executor = BoundedExecutor("test", max_workers=1, queue_size=0)
+    with deadline.deadline_scope(60000):
+        future = executor.submit(deadline.remaining)
+    assert 0 < future.result(timeout=5) <= 60
+
+    assert executor.submit(deadline.remaining).result(timeout=5) is None
@@ -0,0 +1,116 @@
+import sys
+import time
+import types
+
+import pytest
+
+from utils.executor import ExecutorBusyError
+from utils.github_api import RateLimitError
+from utils.job_queue import SECTIONS, JobQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(path=str(tmp_path / "jobs.sqlite3"), max_workers=1, max_attempts=2)
+
+
+@pytest.fixture
+def repository(monkeypatch):
+    """Replace the Repository model run by jobs with one whose sections raise ``error`` if set."""
+    state = {"error": None}
+
+    class Repository:
+        def __init__(self, repo_name):
+            self.repo_name = repo_name
+
+        def section(self):
+            if state["error"] is not None:
+                raise state["error"]
+            return {"repo": self.repo_name}
+
+        fetch_data = get_commit_trends = get_issue_metrics = get_language_analysis = section
+
+    module = types.ModuleType("models.repository")
+    module.Repository = Repository
+    monkeypatch.setitem(sys.modules, "models.repository", module)
+    return state
+
+
+def test_identical_pending_jobs_are_deduplicated(queue):
+    job_id = queue.enqueue("octo/repo")
+    assert queue.enqueue("octo/repo") == job_id
+    assert queue.enqueue("octo/other") != job_id
+
+    job = queue.get(job_id)
+    assert job["status"] == "queued"
+    assert job["progress"] == {section: "pending" for section in SECTIONS}
+    assert queue.get("missing") is None
+
+
+def test_claim_takes_each_job_once(queue):
+    job_id = queue.enqueue("octo/repo")
+    assert queue._claim() == (job_id, "octo/repo")
+    assert queue._claim() is None
+
+    job = queue.get(job_id)
+    assert job["status"] == "running"
+    assert job["attempts"] == 1
+
+
+def test_stale_running_job_is_reclaimed_then_failed(tmp_path):
+    queue = JobQueue(path=str(tmp_path / "jobs.sqlite3"), max_attempts=2, stale_after=0)
+    job_id = queue.enqueue("octo/repo")
+    assert queue._claim()[0] == job_id
+    assert queue._claim()[0] == job_id
+    assert queue._claim() is None
+
+    job = queue.get(job_id)
+    assert job["status"] == "failed"
+    assert job["attempts"] == 2
+
+
+def test_successful_run_stores_the_result(queue, repository):
+    job_id = queue.enqueue("octo/repo")
+    queue._run(*queue._claim())
+
+    job = queue.get(job_id)
+    assert job["status"] == "done"
+    assert job["progress"] == {section: "done" for section in SECTIONS}
+    assert job["result"]["overview"] == {"repo": "octo/repo"}
+
+
+def test_rate_limited_job_is_retried_after_reset(queue, repository):
+    reset_time = time.time() + 60
+    repository["error"] = RateLimitError("rate limited", reset_time)
+    job_id = queue.enqueue("octo/repo")
+    queue._run(*queue._claim())
+
+    job = queue.get(job_id)
+    assert job["status"] == "queued"
+    assert job["retry_at"] >= reset_time
+    assert job["progress"]["overview"] == "failed"
+    # Not runnable before the reset
+    assert queue._claim() is None
+
+
+def test_retryable_job_fails_after_max_attempts(queue, repository):
+    repository["error"] = ExecutorBusyError("busy", retry_after=0)
+    job_id = queue.enqueue("octo/repo")
+    for _ in range(2):
+        queue._update(job_id, run_after=0)
+        queue._run(*queue._claim())
+
+    job = queue.get(job_id)
+    assert job["status"] == "failed"
+    assert job["attempts"] == 2
+    assert job["error"] == "busy"
+
+
+def test_other_errors_fail_right_away(queue, repository):
+    repository["error"] = ValueError("Repository not found")
+    job_id = queue.enqueue("octo/repo")
+    queue._run(*queue._claim())
+
+    job = queue.get(job_id)
+    assert job["status"] == "failed"
+    assert job["error"] == "Repository not found"
@@ -0,0 +1,45 @@
+import pytest
+
+from utils.rate_limiter import RateLimiter
+
+
+@pytest.fixture(params=["local", "shared"])
+def make_limiter(request, tmp_path):
+    path = "" if request.param == "local" else str(tmp_path / "limits.sqlite3")
+    return lambda per_minute, name="search": RateLimiter(name, per_minute, path=path)
+
+
+def test_budget_is_spent_and_released(make_limiter):
+    limiter = make_limiter(3)
+    assert limiter.try_acquire(2)
+    assert not limiter.try_acquire(2)
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+    assert limiter.available() == 0
+
+    limiter.release(2)
+    assert limiter.available() == 2
+
+
+def test_release_never_exceeds_the_budget(make_limiter):
+    limiter = make_limiter(3)
+    limiter.release(5)
+    assert limiter.available() == 3
+
+
+def test_tokens_refill_over_time():
+    limiter = RateLimiter("search", 60, path="")
+    assert limiter.try_acquire(60)
+    limiter._updated_at -= 10
+    assert limiter.available() == 10
+
+
+def test_shared_bucket_is_shared_between_limiters(tmp_path):
+    path = str(tmp_path / "limits.sqlite3")
+    first = RateLimiter("search", 3, path=path)
+    second = RateLimiter("search", 3, path=path)
+    other = RateLimiter("other", 3, path=path)
+
+    assert first.try_acquire(3)
+    assert not second.try_acquire()
+    assert other.try_acquire(3)
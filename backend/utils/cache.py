@@ -1,5 +1,9 @@
 import json
 import os
+import sqlite3
+import tempfile
+import threading
+import time
 from datetime import datetime, timedelta
 import hashlib
 
@@ -112,17 +116,129 @@ class RedisCache(CacheProvider):
             print(f"Redis delete error: {e}")
 
 
+class SharedMemoryCache(CacheProvider):
+    """
+    Host-wide cache shared by all worker processes.
+
+    Entries live in a SQLite database placed on shared memory (``/dev/shm``
+    where available) and read through mmap, so every worker on the host
+    sees the same entries without Redis. SQLite's file locking serializes
+    writers across processes.
+    """
+    def __init__(self, path=None):
+        if path is None:
+            path = os.environ.get('SHARED_CACHE_PATH')
+        if not path:
+            base_dir = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+            path = os.path.join(base_dir, 'repo_analyzer_cache.sqlite3')
+        self.path = path
+        self._local = threading.local()
+        
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+    
+    def _connection(self):
+        """Get a connection for the current thread, reopening it after a fork."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+    
+    def get(self, key):
+        try:
+            row = self._connection().execute(
+                "SELECT value FROM cache WHERE key = ? AND expires_at > ?",
+                (key, time.time())
+            ).fetchone()
+            if row:
+                return json.loads(row[0])
+            return None
+        except sqlite3.Error as e:
+            print(f"Shared cache get error: {e}")
+            return None
+    
+    def set(self, key, value, expire_minutes=60):
+        try:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, default=str), time.time() + expire_minutes * 60)
+            )
+            # Drop expired entries now and then so the store doesn't grow unbounded
+            if hash(key) % 100 == 0:
+                conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+        except sqlite3.Error as e:
+            print(f"Shared cache set error: {e}")
+    
+    def delete(self, key):
+        try:
+            self._connection().execute("DELETE FROM cache WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            print(f"Shared cache delete error: {e}")
+
+
 def get_cache_provider():
     """Factory function to get the appropriate cache provider based on configuration"""
+    backend = os.environ.get('CACHE_BACKEND', '').lower()
     use_redis = os.environ.get('USE_REDIS', 'false').lower() in ('true', '1', 't')
     
-    if use_redis:
+    if backend == 'redis' or (not backend and use_redis):
         try:
             return RedisCache()
         except Exception:
             print("Failed to initialize Redis cache, falling back to memory cache")
     
+    if backend == 'shared':
+        try:
+            return SharedMemoryCache()
+        except Exception as e:
+            print(f"Failed to initialize shared cache: {e}")
+            print("Falling back to in-memory cache")
+    
     return MemoryCache()
 
-# Default cache instance
-cache = get_cache_provider()
\ No newline at end of file
+class LazyCache(CacheProvider):
+    """
+    Cache that creates its provider on app startup instead of at import.
+
+    Connecting to Redis or opening the shared cache is deferred until
+    ``init()`` is called, or until the cache is first used.
+    """
+    def __init__(self, factory=get_cache_provider):
+        self._factory = factory
+        self._provider = None
+        self._lock = threading.Lock()
+    
+    @property
+    def ready(self):
+        """Whether the underlying provider has been created."""
+        return self._provider is not None
+    
+    def init(self):
+        """Create the underlying provider if not done yet and return it."""
+        if self._provider is None:
+            with self._lock:
+                if self._provider is None:
+                    self._provider = self._factory()
+        return self._provider
+    
+    def get(self, key):
+        return self.init().get(key)
+    
+    def set(self, key, value, expire_minutes=60):
+        return self.init().set(key, value, expire_minutes)
+    
+    def delete(self, key):
+        return self.init().delete(key)
+
+
+# Default cache instance, set up by init() on app startup
+cache = LazyCache()
@@ -0,0 +1,141 @@
+import os
+import threading
+from collections import deque
+from time import time
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling GitHub while the circuit breaker is open."""
+
+    def __init__(self, message, reset_time):
+        """
+        Args:
+            message (str): Error message
+            reset_time (float): Unix timestamp at which calls are allowed again
+        """
+        super().__init__(message)
+        self.reset_time = reset_time
+
+    @property
+    def retry_after(self):
+        """Seconds until calls are allowed again."""
+        return max(1, int(self.reset_time - time() + 0.999))
+
+
+class CircuitBreaker:
+    """
+    Process-wide circuit breaker for one GitHub rate limit resource.
+
+    The circuit opens when GitHub reports that the rate limit is exhausted
+    (until the limit resets) or when too many upstream 5xx errors happen in
+    a short window (for a cooldown period). While it is open, calls fail
+    fast without reaching GitHub. After the cooldown a single trial call is
+    let through, and its outcome closes or reopens the circuit.
+    """
+
+    def __init__(self, resource="core", failure_threshold=None, window_seconds=None, cooldown_seconds=None):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            resource (str): GitHub rate limit resource the breaker guards, e.g. "core" or "search"
+            failure_threshold (int): Upstream errors within the window that open the circuit
+            window_seconds (float): Length of the error counting window
+            cooldown_seconds (float): How long the circuit stays open after an error storm
+        """
+        if failure_threshold is None:
+            failure_threshold = int(os.environ.get('BREAKER_FAILURE_THRESHOLD', 5))
+        if window_seconds is None:
+            window_seconds = float(os.environ.get('BREAKER_WINDOW_SECONDS', 60))
+        if cooldown_seconds is None:
+            cooldown_seconds = float(os.environ.get('BREAKER_COOLDOWN_SECONDS', 30))
+
+        self.resource = resource
+        self.failure_threshold = failure_threshold
+        self.window_seconds = window_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self._lock = threading.Lock()
+        self._failures = deque()
+        self._open_until = 0
+        self._reason = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self):
+        """Current state: "closed", "open" or "half_open"."""
+        with self._lock:
+            if self._reason is None:
+                return "closed"
+            return "open" if time() < self._open_until else "half_open"
+
+    def before_call(self):
+        """
+        Check whether a GitHub call may be made.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or a half-open trial call is already running
+        """
+        with self._lock:
+            if self._reason is None:
+                return
+            if time() >= self._open_until and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+            reset_time = max(self._open_until, time() + 1)
+            reason = self._reason
+
+        raise CircuitOpenError(
+            f"GitHub {self.resource} API calls are paused ({reason}). "
+            f"Please try again in {max(1, int(reset_time - time()))} seconds.",
+            reset_time
+        )
+
+    def record_success(self):
+        """Record a successful call, closing the circuit if it was half open."""
+        with self._lock:
+            self._trial_in_flight = False
+            if self._reason is not None and time() >= self._open_until:
+                self._reason = None
+                self._failures.clear()
+
+    def release_trial(self):
+        """Let another call through after a call whose outcome says nothing about GitHub's health."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Record an upstream server error, opening the circuit on an error storm."""
+        now = time()
+        with self._lock:
+            self._trial_in_flight = False
+            self._failures.append(now)
+            while self._failures and self._failures[0] < now - self.window_seconds:
+                self._failures.popleft()
+
+            # A failed trial call reopens the circuit right away
+            if self._reason is not None or len(self._failures) >= self.failure_threshold:
+                self._open(now + self.cooldown_seconds, "upstream errors")
+
+    def record_rate_limited(self, reset_time):
+        """
+        Open the circuit until the GitHub rate limit resets.
+
+        Args:
+            reset_time (float): Unix timestamp at which the rate limit resets
+        """
+        with self._lock:
+            self._trial_in_flight = False
+            self._open(max(reset_time, time() + 1), "rate limit exceeded")
+
+    def _open(self, until, reason):
+        """Open the circuit; callers hold the lock."""
+        self._open_until = max(self._open_until, until) if self._reason is not None else until
+        self._reason = reason
+
+
+# Process-wide circuit breakers, one per GitHub rate limit resource. Search has
+# its own, much smaller limit, so exhausting it must not pause the core API.
+circuit_breakers = {
+    "core": CircuitBreaker("core"),
+    "search": CircuitBreaker("search"),
+}
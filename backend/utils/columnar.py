@@ -0,0 +1,78 @@
+import base64
+from array import array
+
+
+def encode_array(values):
+    """
+    Encode an array as a compact JSON-safe string.
+
+    Args:
+        values (array): Array to encode
+
+    Returns:
+        str: Type code followed by the base64 encoded array bytes
+    """
+    return values.typecode + base64.b64encode(values.tobytes()).decode('ascii')
+
+
+def decode_array(encoded):
+    """
+    Decode a string produced by ``encode_array``.
+
+    Args:
+        encoded (str): Encoded array
+
+    Returns:
+        array: Decoded array
+    """
+    values = array(encoded[0])
+    values.frombytes(base64.b64decode(encoded[1:]))
+    return values
+
+
+class CommitColumns:
+    """
+    Columnar container for commit records.
+
+    Timestamps and author ids are kept in parallel typed arrays, with author
+    logins interned once, so they can be handed to pandas without building
+    a dict per commit.
+    """
+
+    def __init__(self):
+        """Initialize an empty container."""
+        self.timestamps = array('d')
+        self.author_ids = array('I')
+        self.authors = []
+        self._author_index = {}
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def intern_author(self, author):
+        """
+        Get the id of an author login, adding it if it's new.
+
+        Args:
+            author (str): Author login
+
+        Returns:
+            int: Author id
+        """
+        author_id = self._author_index.get(author)
+        if author_id is None:
+            author_id = len(self.authors)
+            self._author_index[author] = author_id
+            self.authors.append(author)
+        return author_id
+
+    def append(self, timestamp, author):
+        """
+        Add a commit.
+
+        Args:
+            timestamp (float): Commit time as a Unix timestamp
+            author (str): Author login
+        """
+        self.timestamps.append(timestamp)
+        self.author_ids.append(self.intern_author(author))
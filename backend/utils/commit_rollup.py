@@ -0,0 +1,263 @@
+from array import array
+from bisect import bisect_left
+from datetime import datetime, date, timedelta
+from utils.columnar import encode_array, decode_array
+
+
+class CommitRollup:
+    """
+    Window-agnostic daily commit rollup for a single repository.
+
+    Holds per-day commit counts and per-day per-author counts as prefix sums
+    over a contiguous range of days ending at ``end_date``. Any window that
+    falls inside the covered range is answered by slicing the prefix sums,
+    so one cached rollup serves every ``days`` value.
+
+    Data is stored in columns: daily prefix sums in a typed array, author
+    logins interned once, and for each author only the days they committed
+    on with the running total at each of those days.
+
+    Sampled per-day counts are estimates; the exact commit count reported
+    by GitHub is kept for the whole covered range and returned for a window
+    that spans it.
+    """
+
+    # Bumped whenever the cached layout changes
+    VERSION = 3
+
+    def __init__(self, start_date, end_date, daily_prefix, authors, author_days, author_totals,
+                 is_sampled=False, sampling_factor=1, fetched_at=None, total_commits=None):
+        """
+        Initialize a rollup from prefix sums.
+
+        Args:
+            start_date (date): First day covered by the rollup
+            end_date (date): Last day covered by the rollup
+            daily_prefix (array): Cumulative commit counts, one more entry than covered days
+            authors (list): Author logins, indexed by author id
+            author_days (list): Per author id, sorted day offsets with commits
+            author_totals (list): Per author id, cumulative commit count at each of those days
+            is_sampled (bool): Whether any covered range was sampled
+            sampling_factor (int): Largest sampling factor used for a covered range
+            fetched_at (datetime): When the newest covered range was fetched
+            total_commits (int): Exact commit count of the covered range, if known
+        """
+        self.start_date = start_date
+        self.end_date = end_date
+        self.daily_prefix = daily_prefix
+        self.authors = authors
+        self.author_days = author_days
+        self.author_totals = author_totals
+        self.is_sampled = is_sampled
+        self.sampling_factor = sampling_factor
+        self.fetched_at = fetched_at or datetime.now()
+        self.total_commits = total_commits
+
+    @property
+    def num_days(self):
+        """Number of days covered by the rollup."""
+        return len(self.daily_prefix) - 1
+
+    @classmethod
+    def from_counts(cls, start_date, end_date, daily_counts, author_daily_counts,
+                    is_sampled=False, sampling_factor=1, fetched_at=None, total_commits=None):
+        """
+        Build a rollup from raw per-day counts.
+
+        Args:
+            start_date (date): First day of the fetched range
+            end_date (date): Last day of the fetched range
+            daily_counts (dict): Date mapped to commit count
+            author_daily_counts (dict): Author login mapped to a {date: count} dict
+            is_sampled (bool): Whether the fetched range was sampled
+            sampling_factor (int): Sampling factor applied to the counts
+            fetched_at (datetime): When the range was fetched
+            total_commits (int): Exact commit count of the range, if known
+
+        Returns:
+            CommitRollup: Rollup covering the fetched range
+        """
+        num_days = max(0, (end_date - start_date).days + 1)
+
+        daily_prefix = array('q', [0] * (num_days + 1))
+        running = 0
+        for offset in range(num_days):
+            running += daily_counts.get(start_date + timedelta(days=offset), 0)
+            daily_prefix[offset + 1] = running
+
+        authors = []
+        author_days = []
+        author_totals = []
+        for author, counts in author_daily_counts.items():
+            offsets = sorted(
+                (day - start_date).days for day in counts if 0 <= (day - start_date).days < num_days
+            )
+            if not offsets:
+                continue
+            totals = array('q')
+            running = 0
+            for offset in offsets:
+                running += counts[start_date + timedelta(days=offset)]
+                totals.append(running)
+            authors.append(author)
+            author_days.append(array('i', offsets))
+            author_totals.append(totals)
+
+        return cls(start_date, end_date, daily_prefix, authors, author_days, author_totals,
+                   is_sampled, sampling_factor, fetched_at, total_commits)
+
+    def covers(self, days, today):
+        """
+        Check whether a window of ``days`` ending today can be served as-is.
+
+        Args:
+            days (int): Window length in days
+            today (date): Current date
+
+        Returns:
+            bool: True if the window lies inside the covered range
+        """
+        return self.end_date == today and self.start_date <= today - timedelta(days=max(0, days))
+
+    def extend_back(self, older):
+        """
+        Prepend an older rollup that ends the day before this one starts.
+
+        Args:
+            older (CommitRollup): Rollup covering the days right before ``start_date``
+        """
+        if older.end_date + timedelta(days=1) != self.start_date:
+            raise ValueError("Older rollup must end the day before this rollup starts")
+
+        shift = older.num_days
+        older_total = older.daily_prefix[-1]
+        daily_prefix = array('q', older.daily_prefix)
+        daily_prefix.extend(count + older_total for count in self.daily_prefix[1:])
+        self.daily_prefix = daily_prefix
+
+        authors = list(older.authors)
+        author_days = [array('i', days) for days in older.author_days]
+        author_totals = [array('q', totals) for totals in older.author_totals]
+        author_index = {author: author_id for author_id, author in enumerate(authors)}
+
+        for author, days, totals in zip(self.authors, self.author_days, self.author_totals):
+            author_id = author_index.get(author)
+            if author_id is None:
+                author_id = len(authors)
+                authors.append(author)
+                author_days.append(array('i'))
+                author_totals.append(array('q'))
+            offset = author_totals[author_id][-1] if author_totals[author_id] else 0
+            author_days[author_id].extend(day + shift for day in days)
+            author_totals[author_id].extend(total + offset for total in totals)
+
+        self.authors = authors
+        self.author_days = author_days
+        self.author_totals = author_totals
+
+        self.start_date = older.start_date
+        self.is_sampled = self.is_sampled or older.is_sampled
+        self.sampling_factor = max(self.sampling_factor, older.sampling_factor)
+        if self.total_commits is None or older.total_commits is None:
+            self.total_commits = None
+        else:
+            self.total_commits += older.total_commits
+
+    def window(self, days, include_daily=True, include_authors=True):
+        """
+        Get commit activity for the last ``days`` days of the rollup.
+
+        Args:
+            days (int): Window length in days
+            include_daily (bool): Whether to build the ``daily_commits`` list
+            include_authors (bool): Whether to build the ``authors`` list
+
+        Returns:
+            dict: Commit activity data in the ``get_commit_activity`` shape,
+            without the lists that weren't asked for
+        """
+        window_start = max(self.start_date, self.end_date - timedelta(days=max(0, days)))
+        first = (window_start - self.start_date).days
+        last = self.num_days
+
+        total_commits = self.daily_prefix[last] - self.daily_prefix[first]
+        if first == 0 and self.total_commits is not None:
+            # The window spans the whole covered range, so the exact count is known
+            total_commits = self.total_commits
+
+        result = {
+            "total_commits": total_commits,
+            "is_sampled": self.is_sampled,
+            "sampling_factor": self.sampling_factor
+        }
+
+        if include_daily:
+            daily_commits = []
+            for offset in range(first, last):
+                count = self.daily_prefix[offset + 1] - self.daily_prefix[offset]
+                if count:
+                    daily_commits.append({
+                        "date": (self.start_date + timedelta(days=offset)).isoformat(),
+                        "count": count
+                    })
+            result["daily_commits"] = daily_commits
+
+        if include_authors:
+            authors = []
+            for author, author_days, totals in zip(self.authors, self.author_days, self.author_totals):
+                # Running total just before the window starts
+                position = bisect_left(author_days, first)
+                count = totals[-1] - (totals[position - 1] if position > 0 else 0)
+                if count:
+                    authors.append({"author": author, "count": count})
+            result["authors"] = sorted(authors, key=lambda x: x["count"], reverse=True)
+
+        return result
+
+    def to_dict(self):
+        """
+        Convert the rollup to a compact JSON-serializable dict for caching.
+
+        Returns:
+            dict: Serialized rollup
+        """
+        return {
+            "version": self.VERSION,
+            "start_date": self.start_date.isoformat(),
+            "end_date": self.end_date.isoformat(),
+            "daily_prefix": encode_array(self.daily_prefix),
+            "authors": self.authors,
+            "author_days": [encode_array(days) for days in self.author_days],
+            "author_totals": [encode_array(totals) for totals in self.author_totals],
+            "is_sampled": self.is_sampled,
+            "sampling_factor": self.sampling_factor,
+            "fetched_at": self.fetched_at.isoformat(),
+            "total_commits": self.total_commits
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create a rollup from its cached dict form.
+
+        Args:
+            data (dict): Serialized rollup as produced by ``to_dict``
+
+        Returns:
+            CommitRollup: Restored rollup, or None if it was cached in an older layout
+        """
+        if data.get("version") != cls.VERSION:
+            return None
+
+        return cls(
+            date.fromisoformat(data["start_date"]),
+            date.fromisoformat(data["end_date"]),
+            decode_array(data["daily_prefix"]),
+            list(data["authors"]),
+            [decode_array(days) for days in data["author_days"]],
+            [decode_array(totals) for totals in data["author_totals"]],
+            data.get("is_sampled", False),
+            data.get("sampling_factor", 1),
+            datetime.fromisoformat(data["fetched_at"]) if data.get("fetched_at") else None,
+            data.get("total_commits")
+        )
@@ -0,0 +1,74 @@
+import contextvars
+from contextlib import contextmanager
+from time import monotonic
+
+# Absolute monotonic time by which the current request must finish
+_deadline = contextvars.ContextVar('deadline', default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when work runs past the deadline of the current request."""
+
+
+@contextmanager
+def deadline_scope(timeout_ms):
+    """
+    Set a deadline for the work done inside the block.
+
+    Args:
+        timeout_ms (int): Milliseconds from now, or None for no deadline
+    """
+    token = _deadline.set(monotonic() + timeout_ms / 1000 if timeout_ms is not None else None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining():
+    """
+    Get the time left before the current deadline.
+
+    Returns:
+        float: Seconds left (never negative), or None if there is no deadline
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - monotonic())
+
+
+def check():
+    """Raise DeadlineExceeded if the current deadline has passed."""
+    if remaining() == 0:
+        raise DeadlineExceeded("Request deadline exceeded")
+
+
+def submit(executor, fn, *args, **kwargs):
+    """
+    Submit work to an executor so it runs under the caller's deadline.
+
+    Returns:
+        Future: Future for the submitted call
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def find_cause(error, exception_type):
+    """
+    Walk an exception chain looking for an exception of the given type.
+
+    Args:
+        error (Exception): Exception to start from
+        exception_type (type): Exception type to look for
+
+    Returns:
+        Exception: The first matching exception in the chain, or None
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, exception_type):
+            return error
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return None
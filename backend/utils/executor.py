@@ -0,0 +1,197 @@
+import concurrent.futures
+import contextvars
+import math
+import os
+import threading
+from collections import deque
+from time import monotonic
+
+
+class ExecutorBusyError(Exception):
+    """Raised when a bounded executor has no room for more work."""
+
+    def __init__(self, message, retry_after):
+        """
+        Args:
+            message (str): Error message
+            retry_after (int): Suggested seconds to wait before retrying
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class BoundedExecutor:
+    """
+    Application-wide thread pool with a bounded queue and admission control.
+
+    At most ``max_workers`` tasks run at once and at most ``queue_size`` more
+    wait for a thread. Work beyond that is rejected with ExecutorBusyError
+    instead of piling up, so callers can shed load early. Queue wait time
+    and utilization are tracked for reporting.
+    """
+
+    def __init__(self, name, max_workers, queue_size, window=500):
+        """
+        Initialize the executor.
+
+        Args:
+            name (str): Name used for threads and stats
+            max_workers (int): Number of worker threads
+            queue_size (int): Maximum number of tasks waiting for a thread
+            window (int): Number of recent tasks kept for wait and duration stats
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pid = None
+        self._pending = 0
+        self._active = 0
+        self._submitted = 0
+        self._rejected = 0
+        self._completed = 0
+        self._busy_seconds = 0.0
+        self._started_at = monotonic()
+        self._waits = deque(maxlen=window)
+        self._durations = deque(maxlen=window)
+
+    @property
+    def capacity(self):
+        """Maximum number of tasks running or queued at once."""
+        return self.max_workers + self.queue_size
+
+    def _get_executor(self):
+        """Get the thread pool for this process, creating it after startup or a fork."""
+        if self._executor is None or self._pid != os.getpid():
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix=self.name
+            )
+            self._pid = os.getpid()
+        return self._executor
+
+    def _retry_after(self):
+        """Estimate how long until there is room again; callers hold the lock."""
+        average_duration = sum(self._durations) / len(self._durations) if self._durations else 1.0
+        backlog = max(1, self._pending - self.max_workers + 1)
+        return max(1, math.ceil(average_duration * backlog / self.max_workers))
+
+    def _run(self, queued_at, context, fn, args, kwargs):
+        """Run a task, recording its queue wait and duration."""
+        started_at = monotonic()
+        with self._lock:
+            self._active += 1
+            self._waits.append(started_at - queued_at)
+        try:
+            return context.run(fn, *args, **kwargs)
+        finally:
+            finished_at = monotonic()
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+                self._busy_seconds += finished_at - started_at
+                self._durations.append(finished_at - started_at)
+
+    def _release(self, future):
+        """Free the slot of a finished or cancelled task."""
+        with self._lock:
+            self._pending -= 1
+
+    def submit_all(self, calls):
+        """
+        Submit several tasks at once, admitting either all of them or none.
+
+        Tasks run with a copy of the caller's context, so request deadlines
+        carry over.
+
+        Args:
+            calls (dict): Task name mapped to a zero-argument callable
+
+        Returns:
+            dict: Task name mapped to its Future
+
+        Raises:
+            ExecutorBusyError: If there isn't room for all the tasks
+        """
+        with self._lock:
+            if self._pending + len(calls) > self.capacity:
+                self._rejected += 1
+                raise ExecutorBusyError(
+                    f"Server is busy ({self.name} queue is full). Please try again later.",
+                    self._retry_after()
+                )
+            self._pending += len(calls)
+            self._submitted += len(calls)
+            executor = self._get_executor()
+
+        queued_at = monotonic()
+        futures = {
+            name: executor.submit(self._run, queued_at, contextvars.copy_context(), fn, (), {})
+            for name, fn in calls.items()
+        }
+        # Slots are freed when a task's future is done, which also covers
+        # queued tasks that are cancelled and never run
+        for future in futures.values():
+            future.add_done_callback(self._release)
+        return futures
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Submit a single task.
+
+        Returns:
+            Future: Future for the task
+
+        Raises:
+            ExecutorBusyError: If the queue is full
+        """
+        return self.submit_all({None: lambda: fn(*args, **kwargs)})[None]
+
+    def stats(self):
+        """
+        Get utilization and queue statistics.
+
+        Returns:
+            dict: Executor statistics
+        """
+        with self._lock:
+            waits = sorted(self._waits)
+            uptime = monotonic() - self._started_at
+            return {
+                "max_workers": self.max_workers,
+                "queue_size": self.queue_size,
+                "active": self._active,
+                "queued": self._pending - self._active,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "utilization": round(self._active / self.max_workers, 3),
+                "average_utilization": round(self._busy_seconds / (self.max_workers * uptime), 3) if uptime > 0 else 0,
+                "queue_wait_ms": {
+                    "average": round(sum(waits) / len(waits) * 1000, 1) if waits else 0,
+                    "p95": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000, 1) if waits else 0,
+                    "max": round(waits[-1] * 1000, 1) if waits else 0,
+                },
+            }
+
+
+# Interactive analysis sections for /api/analyze
+analysis_executor = BoundedExecutor(
+    "analysis",
+    max_workers=int(os.environ.get('ANALYSIS_WORKERS', 16)),
+    queue_size=int(os.environ.get('ANALYSIS_QUEUE_SIZE', 64))
+)
+
+# Bulk fan-out work such as organization rollups
+bulk_executor = BoundedExecutor(
+    "bulk",
+    max_workers=int(os.environ.get('BULK_WORKERS', 8)),
+    queue_size=int(os.environ.get('BULK_QUEUE_SIZE', 32))
+)
+
+# GitHub search count queries; the worker count caps search concurrency process-wide
+search_executor = BoundedExecutor(
+    "search",
+    max_workers=int(os.environ.get('SEARCH_WORKERS', 4)),
+    queue_size=int(os.environ.get('SEARCH_QUEUE_SIZE', 64))
+)
@@ -0,0 +1,89 @@
+def parse_fields(value):
+    """
+    Parse a sparse fieldset such as "commits.total_commits,languages".
+
+    Args:
+        value (str): Comma separated dotted field paths, or None for all fields
+
+    Returns:
+        dict: Nested field tree where True selects a whole subtree, or None for all fields
+    """
+    if not value:
+        return None
+
+    tree = {}
+    for path in value.split(','):
+        parts = [part.strip() for part in path.split('.') if part.strip()]
+        if not parts:
+            continue
+
+        node = tree
+        for part in parts[:-1]:
+            child = node.get(part)
+            if child is True:
+                # A parent already selects everything below it
+                break
+            if child is None:
+                child = node[part] = {}
+            node = child
+        else:
+            node[parts[-1]] = True
+    return tree or None
+
+
+def wants(fields, *path):
+    """
+    Check whether a field path is selected by a field tree.
+
+    Args:
+        fields (dict): Field tree from ``parse_fields``, or None for all fields
+        *path (str): Field path, e.g. ("commits", "author_contributions")
+
+    Returns:
+        bool: True if the field or anything inside it is selected
+    """
+    node = fields
+    for part in path:
+        if node is None or node is True:
+            return True
+        if part not in node:
+            return False
+        node = node[part]
+    return True
+
+
+def subtree(fields, *path):
+    """
+    Get the part of a field tree below a path.
+
+    Returns:
+        dict: Field tree for the path, or None if everything below it is selected
+    """
+    node = fields
+    for part in path:
+        if node is None or node is True:
+            return None
+        node = node.get(part)
+        if node is None:
+            return {}
+    return None if node is True else node
+
+
+def project(data, fields):
+    """
+    Keep only the selected fields of a response.
+
+    Args:
+        data: Response data
+        fields (dict): Field tree from ``parse_fields``, or None for all fields
+
+    Returns:
+        Data with unselected fields removed
+    """
+    if fields is None or fields is True:
+        return data
+    if isinstance(data, dict):
+        return {key: project(data[key], fields[key]) for key in fields if key in data}
+    if isinstance(data, list):
+        return [project(item, fields) for item in data]
+    return data
@@ -1,14 +1,88 @@
+import math
 import os
-import pandas as pd
-from github import Github
-from github.GithubException import GithubException, BadCredentialsException, RateLimitExceededException
-from datetime import datetime, timedelta
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from utils import deadline
 from utils.cache import cache
+from utils.circuit_breaker import CircuitOpenError, circuit_breakers
+from utils.columnar import CommitColumns
+from utils.commit_rollup import CommitRollup
+from utils.executor import ExecutorBusyError, search_executor
+from utils.hedging import hedged_requests
+from utils.rate_limiter import search_rate_limiter
+
+# Day thresholds at which time-to-close is measured
+RESOLUTION_THRESHOLDS_DAYS = (1, 7, 30, 90, 365)
+
+# Time to close is measured over issues closed in this many days, one search per day
+# and threshold. Matches the last week of the histogram, which provides the total.
+RESOLUTION_WINDOW_DAYS = 7
+
+# Counts for buckets entirely in the past don't change, keep them for a week
+PAST_BUCKET_EXPIRE_MINUTES = 7 * 24 * 60
+
+# Repository lookup errors that are cached, and for how long
+NEGATIVE_CACHE_STATUSES = (403, 404, 451)
+NEGATIVE_CACHE_MINUTES = 5
+
+# PyGithub and pandas are slow to import, so they are loaded on first use
+# by load_dependencies() rather than when this module is imported
+pd = None
+Github = None
+GithubException = None
+BadCredentialsException = None
+RateLimitExceededException = None
+# Connection errors and timeouts of requests made by PyGithub
+NETWORK_ERRORS = ()
+
+# GithubException statuses that count as upstream failures for the circuit breaker
+UPSTREAM_ERROR_STATUSES = (429,)
+
+
+def load_dependencies():
+    """Import PyGithub and pandas into this module if not done yet."""
+    global pd, Github, GithubException, BadCredentialsException, RateLimitExceededException, NETWORK_ERRORS
+    
+    if Github is None:
+        import pandas
+        import requests
+        from github import Github as github_client
+        from github.GithubException import (
+            GithubException as github_exception,
+            BadCredentialsException as bad_credentials_exception,
+            RateLimitExceededException as rate_limit_exceeded_exception,
+        )
+        
+        pd = pandas
+        GithubException = github_exception
+        BadCredentialsException = bad_credentials_exception
+        RateLimitExceededException = rate_limit_exceeded_exception
+        NETWORK_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout, ConnectionError, TimeoutError)
+        Github = github_client
+
+
+class RateLimitError(Exception):
+    """Raised when the GitHub API rate limit is exceeded."""
+    
+    def __init__(self, message, reset_time=None):
+        """
+        Args:
+            message (str): Error message
+            reset_time (float): Unix timestamp at which the rate limit resets
+        """
+        super().__init__(message)
+        self.reset_time = reset_time
 
 
 class GitHubAnalyzer:
     """Utility class to interact with GitHub API and analyze repositories."""
     
+    # GitHub clients by token, created and validated once per process
+    _clients = {}
+    _clients_lock = threading.Lock()
+    
     def __init__(self, token=None):
         """Initialize GitHub connection with token."""
         if token is None:
@@ -17,15 +91,148 @@ class GitHubAnalyzer:
         if not token:
             raise ValueError("GitHub token is required. Please set GITHUB_TOKEN in your .env file.")
         
+        self.github = self.get_client(token)
+    
+    @classmethod
+    def get_client(cls, token):
+        """
+        Get the shared GitHub client for a token, creating it on first use.
+        
+        Args:
+            token (str): GitHub token
+            
+        Returns:
+            Github: Validated GitHub client
+        """
+        client = cls._clients.get(token)
+        if client is not None:
+            return client
+        
+        with cls._clients_lock:
+            client = cls._clients.get(token)
+            if client is not None:
+                return client
+            
+            load_dependencies()
+            try:
+                # Configure Github with increased per_page and retry settings
+                client = Github(token, per_page=100, retry=3)
+                # Test the token with a simple API call, through the circuit breaker
+                # of an analyzer bound to the new client
+                analyzer = cls.__new__(cls)
+                analyzer.github = client
+                analyzer._call_github(lambda: client.get_user().login, hedge=False)
+            except BadCredentialsException:
+                raise ValueError("Invalid GitHub token. Please check your token and ensure it has the necessary permissions.")
+            except RateLimitExceededException as e:
+                raise analyzer._rate_limit_error(e)
+            except (CircuitOpenError, deadline.DeadlineExceeded):
+                raise
+            except Exception as e:
+                raise ValueError(f"Error initializing GitHub API client: {e}")
+            
+            cls._clients[token] = client
+            return client
+    
+    @classmethod
+    def clear_clients(cls):
+        """Drop the shared GitHub clients, e.g. in a forked process that must not reuse the parent's connections."""
+        with cls._clients_lock:
+            cls._clients.clear()
+    
+    @contextmanager
+    def _github_requests(self, resource="core"):
+        """
+        Run GitHub requests, such as a paginated crawl, through the circuit breaker.
+        
+        Raises CircuitOpenError without making a request while the breaker
+        of ``resource`` is open. Rate limits, upstream 5xx and 429 errors,
+        connection errors and timeouts raised inside the block are reported
+        to the breaker. Other errors, such as a 404 or a bug in the caller,
+        say nothing about GitHub's health and are re-raised untouched.
+        """
+        circuit_breaker = circuit_breakers[resource]
+        circuit_breaker.before_call()
         try:
-            # Configure Github with increased per_page and retry settings
-            self.github = Github(token, per_page=100, retry=3)
-            # Test the token with a simple API call
-            self.github.get_user().login
-        except BadCredentialsException:
-            raise ValueError("Invalid GitHub token. Please check your token and ensure it has the necessary permissions.")
-        except Exception as e:
-            raise ValueError(f"Error initializing GitHub API client: {e}")
+            yield
+        except RateLimitExceededException as e:
+            circuit_breaker.record_rate_limited(self._rate_limit_reset_time(e))
+            raise
+        except GithubException as e:
+            if e.status is not None and (e.status >= 500 or e.status in UPSTREAM_ERROR_STATUSES):
+                circuit_breaker.record_failure()
+            else:
+                # GitHub answered, so it is up
+                circuit_breaker.record_success()
+            raise
+        except NETWORK_ERRORS:
+            circuit_breaker.record_failure()
+            raise
+        except BaseException:
+            # Let another call through if this one was a half-open trial
+            circuit_breaker.release_trial()
+            raise
+        circuit_breaker.record_success()
+    
+    def _call_github(self, fn, *args, hedge=True, resource="core", **kwargs):
+        """
+        Make a single GitHub request through the circuit breaker of its rate limit resource.
+        
+        The request is hedged if it is slow, unless ``hedge`` is False.
+        """
+        with self._github_requests(resource):
+            if hedge:
+                return hedged_requests.call(fn, *args, **kwargs)
+            deadline.check()
+            return fn(*args, **kwargs)
+    
+    @staticmethod
+    def _rate_limit_resource(error):
+        """Get the GitHub rate limit resource ("core" or "search") behind an exception."""
+        resource = (error.headers or {}).get('x-ratelimit-resource')
+        return resource if resource in circuit_breakers else "core"
+    
+    def _rate_limit_reset_time(self, error):
+        """Get when the rate limit behind an exception resets, as a Unix timestamp."""
+        # Search has its own rate limit, so prefer the one reported with the response
+        headers = error.headers or {}
+        return float(headers.get('x-ratelimit-reset', self.github.rate_limiting_resettime))
+    
+    def _rate_limit_error(self, error):
+        """
+        Convert a PyGithub rate limit exception and open the circuit breaker of its resource.
+        
+        Args:
+            error (RateLimitExceededException): Exception raised by PyGithub
+            
+        Returns:
+            RateLimitError: Error to raise
+        """
+        reset_time = self._rate_limit_reset_time(error)
+        circuit_breakers[self._rate_limit_resource(error)].record_rate_limited(reset_time)
+        wait_minutes = (reset_time - datetime.now().timestamp()) / 60
+        return RateLimitError(f"GitHub API rate limit exceeded. Please try again in {wait_minutes:.1f} minutes.", reset_time)
+    
+    def _get_repo(self, repo_name):
+        """
+        Fetch a PyGithub repository object.
+        
+        Lookups that fail with 404, 403 or 451 are cached for a few minutes,
+        so requests for missing or private repositories don't reach GitHub
+        again until the entry expires.
+        """
+        cached_error, cache_key = self._get_from_cache('get_repo_error', repo_name)
+        if cached_error:
+            raise GithubException(cached_error["status"], cached_error["data"], None)
+        
+        try:
+            return self._call_github(self.github.get_repo, repo_name)
+        except RateLimitExceededException:
+            raise
+        except GithubException as e:
+            if e.status in NEGATIVE_CACHE_STATUSES:
+                self._save_to_cache(cache_key, {"status": e.status, "data": e.data}, NEGATIVE_CACHE_MINUTES)
+            raise
     
     def _get_from_cache(self, method_name, repo_name, **kwargs):
         """Get data from cache if available."""
@@ -51,7 +258,7 @@ class GitHubAnalyzer:
             return cached_data
             
         try:
-            repo = self.github.get_repo(repo_name)
+            repo = self._get_repo(repo_name)
             result = {
                 "name": repo.name,
                 "full_name": repo.full_name,
@@ -72,9 +279,7 @@ class GitHubAnalyzer:
             return result
             
         except RateLimitExceededException as e:
-            reset_time = self.github.rate_limiting_resettime
-            wait_minutes = (reset_time - datetime.now().timestamp()) / 60
-            raise Exception(f"GitHub API rate limit exceeded. Please try again in {wait_minutes:.1f} minutes.")
+            raise self._rate_limit_error(e)
         except GithubException as e:
             raise Exception(f"Error fetching repository: {e}")
     
@@ -94,56 +299,49 @@ class GitHubAnalyzer:
             return cached_data
         
         try:
-            repo = self.github.get_repo(repo_name)
+            repo = self._get_repo(repo_name)
             contributors = repo.get_contributors()
             
             result = []
-            for contributor in contributors[:limit]:
-                result.append({
-                    "login": contributor.login,
-                    "id": contributor.id,
-                    "contributions": contributor.contributions,
-                    "url": contributor.html_url,
-                    "avatar_url": contributor.avatar_url,
-                })
+            with self._github_requests():
+                for contributor in contributors[:limit]:
+                    deadline.check()
+                    result.append({
+                        "login": contributor.login,
+                        "id": contributor.id,
+                        "contributions": contributor.contributions,
+                        "url": contributor.html_url,
+                        "avatar_url": contributor.avatar_url,
+                    })
             
             # Cache the result
             self._save_to_cache(cache_key, result)
             return result
         except RateLimitExceededException as e:
-            reset_time = self.github.rate_limiting_resettime
-            wait_minutes = (reset_time - datetime.now().timestamp()) / 60
-            raise Exception(f"GitHub API rate limit exceeded. Please try again in {wait_minutes:.1f} minutes.")
+            raise self._rate_limit_error(e)
         except GithubException as e:
             raise Exception(f"Error fetching contributors: {e}")
     
-    def get_commit_activity(self, repo_name, days=30, sample_size=500):
+    def _fetch_commit_counts(self, repo, start_date, end_date, until, sample_size=500):
         """
-        Get commit activity for a repository.
+        Fetch commits for a day range and count them per day and per author.
         
         Args:
-            repo_name (str): Repository name in format "owner/repo"
-            days (int): Number of days to analyze
-            sample_size (int): Maximum number of commits to analyze for large repos
+            repo: PyGithub repository object
+            start_date (date): First UTC day of the range
+            end_date (date): Last UTC day of the range
+            until (datetime): Upper bound for commit timestamps
+            sample_size (int): Maximum number of commits to analyze for large ranges
             
         Returns:
-            dict: Commit activity data
+            CommitRollup: Rollup covering the range
         """
-        cached_data, cache_key = self._get_from_cache('get_commit_activity', repo_name, days=days)
-        if cached_data:
-            return cached_data
-        
-        try:
-            repo = self.github.get_repo(repo_name)
+        since = datetime.combine(start_date, datetime.min.time(), tzinfo=timezone.utc)
+        # Page requests of the crawl go through the circuit breaker too
+        with self._github_requests():
+            commits = repo.get_commits(since=since, until=until)
             
-            # Calculate date range
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days)
-            
-            # Get commits in date range
-            commits = repo.get_commits(since=start_date, until=end_date)
-            
-            # Check if repository has too many commits
+            # Check if the range has too many commits
             total_count = 0
             is_sampled = False
             try:
@@ -152,218 +350,324 @@ class GitHubAnalyzer:
             except:
                 # If we can't get total count, proceed with sampling
                 is_sampled = True
-                
-            # Process commits - with sampling for large repos
-            commit_data = []
+            
+            # Process commits - with sampling for large ranges
+            commit_data = CommitColumns()
             sampling_factor = 1
             
             if is_sampled:
-                # Estimate how many commits to skip
+                # Round up so the samples span the whole range, not just its newest commits
                 try:
-                    sampling_factor = max(1, total_count // sample_size)
+                    sampling_factor = max(1, math.ceil(total_count / sample_size))
                 except:
                     sampling_factor = 5  # Default if we can't calculate
-                
-                count = 0
-                for commit in commits:
-                    if count % sampling_factor == 0:  # Sample every Nth commit
-                        commit_data.append({
-                            "sha": commit.sha,
-                            "author": commit.author.login if commit.author else "Unknown",
-                            "date": commit.commit.author.date.isoformat(),
-                            "message": commit.commit.message,
-                        })
-                    count += 1
-                    if len(commit_data) >= sample_size:
-                        break
-            else:
-                # Get all commits for smaller repos
-                for commit in commits:
-                    commit_data.append({
-                        "sha": commit.sha,
-                        "author": commit.author.login if commit.author else "Unknown",
-                        "date": commit.commit.author.date.isoformat(),
-                        "message": commit.commit.message,
-                    })
             
-            # Create DataFrame for analysis
-            df = pd.DataFrame(commit_data)
+            count = 0
+            for commit in commits:
+                # Stop crawling once the request deadline has passed
+                deadline.check()
+                if count % sampling_factor == 0:  # Sample every Nth commit
+                    commit_data.append(
+                        commit.commit.author.date.timestamp(),
+                        commit.author.login if commit.author else "Unknown"
+                    )
+                count += 1
+                if is_sampled and len(commit_data) >= sample_size:
+                    break
+        
+        daily_counts = {}
+        author_daily_counts = {}
+        
+        # Create DataFrame for analysis straight from the columns
+        if len(commit_data) > 0:
+            df = pd.DataFrame({
+                'author_id': commit_data.author_ids,
+                'date': pd.to_datetime(commit_data.timestamps, unit='s', utc=True).date,
+            })
             
-            # Only proceed if we have commits
-            if len(df) == 0:
-                result = {
-                    "total_commits": 0,
-                    "daily_commits": [],
-                    "authors": [],
-                    "is_sampled": False,
-                    "sampling_factor": 1
-                }
-                self._save_to_cache(cache_key, result)
-                return result
+            # Daily commit counts, scaled back up if sampled
+            for day, day_count in df.groupby('date').size().items():
+                daily_counts[day] = int(day_count) * sampling_factor
             
-            # Extract date from datetime
-            if 'date' in df.columns:
-                df['date'] = pd.to_datetime(df['date']).dt.date
-                
-                # Daily commit counts
-                daily_commits = df.groupby('date').size().reset_index()
-                daily_commits.columns = ['date', 'count']
-                
-                # Adjust counts if sampled
-                if is_sampled:
-                    daily_commits['count'] = daily_commits['count'] * sampling_factor
-                
-                # Author stats
-                author_stats = df.groupby('author').size().reset_index()
-                author_stats.columns = ['author', 'count']
-                
-                # Adjust counts if sampled
-                if is_sampled:
-                    author_stats['count'] = author_stats['count'] * sampling_factor
-                    
-                author_stats = author_stats.sort_values('count', ascending=False)
-                
-                result = {
-                    "total_commits": total_count if is_sampled else len(df),
-                    "daily_commits": daily_commits.to_dict('records'),
-                    "authors": author_stats.to_dict('records'),
-                    "is_sampled": is_sampled,
-                    "sampling_factor": sampling_factor
-                }
-                self._save_to_cache(cache_key, result)
-                return result
+            # Per-day author counts, scaled back up if sampled
+            for (author_id, day), day_count in df.groupby(['author_id', 'date']).size().items():
+                author = commit_data.authors[author_id]
+                author_daily_counts.setdefault(author, {})[day] = int(day_count) * sampling_factor
+        
+        return CommitRollup.from_counts(
+            start_date, end_date, daily_counts, author_daily_counts,
+            is_sampled=is_sampled, sampling_factor=sampling_factor,
+            total_commits=total_count if total_count else None
+        )
+    
+    def get_commit_activity(self, repo_name, days=30, sample_size=500,
+                            include_daily=True, include_authors=True):
+        """
+        Get commit activity for a repository.
+        
+        Every ``days`` value is served from one cached daily rollup per
+        repository. A window longer than the cached range only fetches the
+        missing older days.
+        
+        Args:
+            repo_name (str): Repository name in format "owner/repo"
+            days (int): Number of days to analyze
+            sample_size (int): Maximum number of commits to analyze for large repos
+            include_daily (bool): Whether to include the ``daily_commits`` list
+            include_authors (bool): Whether to include the ``authors`` list
+            
+        Returns:
+            dict: Commit activity data
+        """
+        days = max(0, days)
+        # Days are UTC days, matching how commits are bucketed
+        today = datetime.now(timezone.utc).date()
+        window_start = today - timedelta(days=days)
+        
+        cached_data, cache_key = self._get_from_cache('get_commit_rollup', repo_name)
+        rollup = CommitRollup.from_dict(cached_data) if cached_data else None
+        
+        # A rollup built on an earlier day is missing today's commits
+        if rollup is not None and rollup.end_date != today:
+            rollup = None
+        
+        if rollup is not None and rollup.covers(days, today):
+            return rollup.window(days, include_daily, include_authors)
+        
+        try:
+            repo = self._get_repo(repo_name)
+            
+            if rollup is None:
+                rollup = self._fetch_commit_counts(
+                    repo, window_start, today, datetime.now(timezone.utc), sample_size
+                )
+                self._save_to_cache(cache_key, rollup.to_dict())
             else:
-                result = {
-                    "total_commits": 0,
-                    "daily_commits": [],
-                    "authors": [],
-                    "is_sampled": False,
-                    "sampling_factor": 1
-                }
-                self._save_to_cache(cache_key, result)
-                return result
+                # Only fetch the older days the cached rollup doesn't cover
+                older_end = rollup.start_date - timedelta(days=1)
+                until = datetime.combine(rollup.start_date, datetime.min.time(), tzinfo=timezone.utc) - timedelta(seconds=1)
+                older = self._fetch_commit_counts(repo, window_start, older_end, until, sample_size)
+                rollup.extend_back(older)
+                
+                # Keep the expiry of the newest data rather than restarting it
+                elapsed_minutes = (datetime.now() - rollup.fetched_at).total_seconds() / 60
+                self._save_to_cache(cache_key, rollup.to_dict(), max(1, 60 - elapsed_minutes))
+            
+            return rollup.window(days, include_daily, include_authors)
         except RateLimitExceededException as e:
-            reset_time = self.github.rate_limiting_resettime
-            wait_minutes = (reset_time - datetime.now().timestamp()) / 60
-            raise Exception(f"GitHub API rate limit exceeded. Please try again in {wait_minutes:.1f} minutes.")
+            raise self._rate_limit_error(e)
         except GithubException as e:
             raise Exception(f"Error analyzing commit activity: {e}")
     
-    def get_issues_analysis(self, repo_name, max_issues=100):
+    def _search_issue_count(self, repo_name, query, cache_key, expire_minutes=60):
+        """
+        Count issues matching a search query without downloading them.
+        
+        Args:
+            repo_name (str): Repository name in format "owner/repo"
+            query (str): Full search query
+            cache_key (str): Cache key for the count
+            expire_minutes (int): How long to cache the count
+            
+        Returns:
+            int: Number of matching issues
+        """
+        # Search requests are scarce, so they are never hedged.
+        # Ask for a single item; only total_count is used
+        try:
+            _, data = self._call_github(
+                self.github.requester.requestJsonAndCheck,
+                "GET", "/search/issues", parameters={"q": query, "per_page": 1},
+                hedge=False, resource="search"
+            )
+        except (CircuitOpenError, deadline.DeadlineExceeded):
+            # Raised before the request was sent, so its search token is returned
+            search_rate_limiter.release()
+            raise
+        count = data.get("total_count", 0)
+        self._save_to_cache(cache_key, count, expire_minutes)
+        return count
+    
+    @staticmethod
+    def _resolution_percentile(thresholds, closed_within, total, percentile):
+        """Interpolate the days within which ``percentile`` percent of issues were closed."""
+        target = total * percentile / 100
+        prev_days, prev_count = 0, 0
+        for days, count in zip(thresholds, closed_within):
+            if count >= target:
+                if count == prev_count:
+                    return days
+                return round(prev_days + (target - prev_count) / (count - prev_count) * (days - prev_days), 2)
+            prev_days, prev_count = days, count
+        # More than the largest threshold
+        return None
+    
+    def get_issues_analysis(self, repo_name, weeks=12):
         """
         Analyze issues for a repository.
         
+        Everything is computed from search count queries, so no issue is
+        downloaded and pull requests are excluded. Each count is cached on
+        its own, and counts for days and weeks that have ended are kept for
+        a week since they no longer change.
+        
+        Time to close is measured only over a sample: the issues closed in the
+        last 7 days, with one bucket per closing day. An issue closed on day D
+        counts as closed within ``d`` days if it was created after day D - d,
+        so every counted issue was open less than ``d`` days, while one open
+        between ``d - 1`` and ``d`` days may be missed. Thresholds are
+        therefore at calendar-day resolution, and the response states the
+        sample window and size.
+        
+        GitHub allows only 30 search requests per minute, which a cold
+        analysis exceeds. Counts that don't fit in the remaining search budget
+        are left out and fetched by later calls; until then the result is
+        marked ``is_partial`` and the missing values are None.
+        
         Args:
             repo_name (str): Repository name in format "owner/repo"
-            max_issues (int): Maximum number of issues to analyze
+            weeks (int): Number of weeks for the histogram
             
         Returns:
             dict: Issue analysis data
         """
-        cached_data, cache_key = self._get_from_cache('get_issues_analysis', repo_name, max_issues=max_issues)
+        cached_data, cache_key = self._get_from_cache('get_issues_analysis', repo_name, weeks=weeks)
         if cached_data:
             return cached_data
         
         try:
-            repo = self.github.get_repo(repo_name)
+            # Search qualifiers are evaluated in UTC
+            today = datetime.now(timezone.utc).date()
+            weeks = max(1, weeks)
             
-            # Get open and closed issues
-            try:
-                open_issues = repo.get_issues(state='open')
-                open_issues_count = open_issues.totalCount
-            except Exception:
-                open_issues = []
-                open_issues_count = 0
-                
-            try:
-                closed_issues = repo.get_issues(state='closed')
-                closed_issues_count = closed_issues.totalCount
-            except Exception:
-                closed_issues = []
-                closed_issues_count = 0
-            
-            # Process open issues
-            open_issues_data = []
-            try:
-                # Determine if we need to sample
-                is_sampled = open_issues_count > max_issues
-                sampling_factor = max(1, open_issues_count // max_issues) if is_sampled else 1
-                
-                count = 0
-                for issue in open_issues:
-                    # Sample if needed
-                    if count % sampling_factor == 0:
-                        try:
-                            open_issues_data.append({
-                                "number": issue.number,
-                                "title": issue.title,
-                                "state": issue.state,
-                                "created_at": issue.created_at.isoformat(),
-                                "updated_at": issue.updated_at.isoformat(),
-                                "user": issue.user.login if issue.user else "Unknown",
-                            })
-                        except Exception:
-                            # Skip problematic issues
-                            pass
-                    
-                    count += 1
-                    if len(open_issues_data) >= max_issues:
-                        break
-            except Exception:
-                # If any error occurs processing open issues, continue with empty list
-                pass
+            # Week buckets, oldest first, the last one ending today
+            buckets = []
+            for index in range(weeks):
+                week_end = today - timedelta(days=7 * (weeks - index - 1))
+                week_start = week_end - timedelta(days=6)
+                buckets.append((week_start, week_end))
             
-            # Process closed issues
-            closed_issues_data = []
-            try:
-                # Determine if we need to sample
-                is_sampled = closed_issues_count > max_issues
-                sampling_factor = max(1, closed_issues_count // max_issues) if is_sampled else 1
-                
-                count = 0
-                for issue in closed_issues:
-                    # Sample if needed
-                    if count % sampling_factor == 0:
-                        try:
-                            closed_issues_data.append({
-                                "number": issue.number,
-                                "title": issue.title,
-                                "state": issue.state,
-                                "created_at": issue.created_at.isoformat(),
-                                "closed_at": issue.closed_at.isoformat() if issue.closed_at else None,
-                                "user": issue.user.login if issue.user else "Unknown",
-                            })
-                        except Exception:
-                            # Skip problematic issues
-                            pass
-                    
-                    count += 1
-                    if len(closed_issues_data) >= max_issues:
-                        break
-            except Exception:
-                # If any error occurs processing closed issues, continue with empty list
-                pass
+            def expiry(last_day):
+                return PAST_BUCKET_EXPIRE_MINUTES if last_day < today else 60
+            
+            # Queries in priority order: totals, then the histogram newest week
+            # first, then the time to close buckets newest day first
+            queries = {
+                "open": ("is:open", 60),
+                "closed": ("is:closed", 60),
+            }
+            for index in reversed(range(weeks)):
+                week_start, week_end = buckets[index]
+                date_range = f"{week_start.isoformat()}..{week_end.isoformat()}"
+                queries[("created", index)] = (f"created:{date_range}", expiry(week_end))
+                queries[("closed", index)] = (f"closed:{date_range}", expiry(week_end))
+            
+            closing_days = [today - timedelta(days=offset) for offset in range(RESOLUTION_WINDOW_DAYS)]
+            for day in closing_days:
+                for days in RESOLUTION_THRESHOLDS_DAYS:
+                    created_after = (day - timedelta(days=days)).isoformat()
+                    queries[("within", day, days)] = (
+                        f"closed:{day.isoformat()} created:>{created_after}", expiry(day)
+                    )
+            
+            # Serve what is cached
+            counts = {}
+            uncached = []
+            for name, (qualifiers, expire_minutes) in queries.items():
+                query = f"repo:{repo_name} is:issue {qualifiers}"
+                count, count_key = self._get_from_cache('search_issue_count', repo_name, query=query)
+                if count is not None:
+                    counts[name] = count
+                else:
+                    uncached.append((name, query, count_key, expire_minutes))
+            
+            # Nothing useful can be returned without the totals, so their tokens are taken
+            # together, before any other
+            missing = [item for item in uncached if item[0] in ("open", "closed")]
+            if missing and not search_rate_limiter.try_acquire(len(missing)):
+                reset_time = datetime.now().timestamp() + len(missing) * 60 / search_rate_limiter.per_minute
+                raise RateLimitError("GitHub search budget used up. Please try again shortly.", reset_time)
+            
+            # Spend the rest of the search budget on the other counts, in priority order
+            for item in uncached:
+                if item[0] in ("open", "closed"):
+                    continue
+                if not search_rate_limiter.try_acquire():
+                    break
+                missing.append(item)
+            
+            # Run the uncached count queries in parallel on the shared search executor
+            if missing:
+                try:
+                    futures = search_executor.submit_all({
+                        name: partial(self._search_issue_count, repo_name, query, count_key, expire_minutes)
+                        for name, query, count_key, expire_minutes in missing
+                    })
+                except ExecutorBusyError:
+                    # None of the queries were sent
+                    search_rate_limiter.release(len(missing))
+                    raise
+                counts.update({name: future.result() for name, future in futures.items()})
+            
+            weekly = []
+            for index, (week_start, week_end) in enumerate(buckets):
+                weekly.append({
+                    "week_start": week_start.isoformat(),
+                    "week_end": week_end.isoformat(),
+                    "created": counts.get(("created", index)),
+                    "closed": counts.get(("closed", index)),
+                })
+            
+            # The last week bucket is the time to close window, so its closed count is the total
+            closed_in_window = counts.get(("closed", weeks - 1))
+            closed_within = [
+                sum(counts[("within", day, days)] for day in closing_days)
+                if all(("within", day, days) in counts for day in closing_days) else None
+                for days in RESOLUTION_THRESHOLDS_DAYS
+            ]
             
+            resolution_time = None
+            if closed_in_window is not None and None not in closed_within:
+                resolution_time = {
+                    "window_days": RESOLUTION_WINDOW_DAYS,
+                    "closed_in_window": closed_in_window,
+                    # Percentiles only describe the issues closed in the window
+                    "sample_size": closed_in_window,
+                    "thresholds": [
+                        {"days": days, "closed_within": count}
+                        for days, count in zip(RESOLUTION_THRESHOLDS_DAYS, closed_within)
+                    ],
+                    "percentiles": {
+                        f"p{percentile}": self._resolution_percentile(
+                            RESOLUTION_THRESHOLDS_DAYS, closed_within, closed_in_window, percentile
+                        ) if closed_in_window else None
+                        for percentile in (50, 75, 90)
+                    },
+                }
+            
+            is_partial = len(counts) < len(queries)
             result = {
-                "open_issues_count": open_issues_count,
-                "closed_issues_count": closed_issues_count,
-                "open_issues": open_issues_data,
-                "closed_issues": closed_issues_data,
+                "open_issues_count": counts["open"],
+                "closed_issues_count": counts["closed"],
+                "weekly": weekly,
+                "resolution_time": resolution_time,
+                "is_partial": is_partial,
             }
-            self._save_to_cache(cache_key, result)
+            # Partial results are rebuilt on the next call from the cached counts
+            if not is_partial:
+                self._save_to_cache(cache_key, result)
             return result
         except RateLimitExceededException as e:
-            reset_time = self.github.rate_limiting_resettime
-            wait_minutes = (reset_time - datetime.now().timestamp()) / 60
-            raise Exception(f"GitHub API rate limit exceeded. Please try again in {wait_minutes:.1f} minutes.")
+            raise self._rate_limit_error(e)
         except GithubException as e:
             # For repositories with no issues or issues disabled
             if e.status == 404 or e.status == 410:
                 result = {
                     "open_issues_count": 0,
                     "closed_issues_count": 0,
-                    "open_issues": [],
-                    "closed_issues": []
+                    "weekly": [],
+                    "resolution_time": None,
+                    "is_partial": False
                 }
                 self._save_to_cache(cache_key, result)
                 return result
@@ -384,8 +688,8 @@ class GitHubAnalyzer:
             return cached_data
         
         try:
-            repo = self.github.get_repo(repo_name)
-            languages = repo.get_languages()
+            repo = self._get_repo(repo_name)
+            languages = self._call_github(repo.get_languages)
             
             total_bytes = sum(languages.values())
             
@@ -409,23 +713,66 @@ class GitHubAnalyzer:
             self._save_to_cache(cache_key, result)
             return result
         except RateLimitExceededException as e:
-            reset_time = self.github.rate_limiting_resettime
-            wait_minutes = (reset_time - datetime.now().timestamp()) / 60
-            raise Exception(f"GitHub API rate limit exceeded. Please try again in {wait_minutes:.1f} minutes.")
+            raise self._rate_limit_error(e)
         except GithubException as e:
             raise Exception(f"Error fetching languages: {e}")
     
-    def get_repository_overview(self, repo_name):
+    def get_owner_repositories(self, owner, limit=100):
+        """
+        List repositories of a user or organization, most recently pushed first.
+        
+        For an organization this includes the private repositories the token can see.
+        
+        Args:
+            owner (str): User or organization login
+            limit (int): Maximum number of repositories to return
+            
+        Returns:
+            list: Repository names in format "owner/repo"
+        """
+        cached_data, cache_key = self._get_from_cache('get_owner_repositories', owner, limit=limit)
+        if cached_data:
+            return cached_data
+        
+        try:
+            result = []
+            with self._github_requests():
+                account = self.github.get_user(owner)
+                if account.type == "Organization":
+                    # The user endpoint lists only an organization's public repositories
+                    repos = self.github.get_organization(owner).get_repos(
+                        type='all', sort='pushed', direction='desc'
+                    )
+                else:
+                    repos = account.get_repos(sort='pushed', direction='desc')
+                for repo in repos:
+                    deadline.check()
+                    result.append(repo.full_name)
+                    if len(result) >= limit:
+                        break
+            
+            # Cache the result
+            self._save_to_cache(cache_key, result)
+            return result
+        except RateLimitExceededException as e:
+            raise self._rate_limit_error(e)
+        except GithubException as e:
+            raise Exception(f"Error listing repositories: {e}")
+    
+    def get_repository_overview(self, repo_name, include_commit_activity=True):
         """
         Get comprehensive overview of a repository.
         
         Args:
             repo_name (str): Repository name in format "owner/repo"
+            include_commit_activity (bool): Whether to embed the last 30 days of commit activity
             
         Returns:
             dict: Repository overview data
         """
-        cached_data, cache_key = self._get_from_cache('get_repository_overview', repo_name)
+        cached_data, cache_key = self._get_from_cache(
+            'get_repository_overview', repo_name, include_commit_activity=include_commit_activity
+        )
         if cached_data:
             return cached_data
         
@@ -439,17 +786,17 @@ class GitHubAnalyzer:
             # Get languages
             languages = self.get_languages(repo_name)
             
-            # Get commit activity for last 30 days
-            commit_activity = self.get_commit_activity(repo_name, days=30)
-            
             # Combine all data
             overview = {
                 "repository": repo_info,
                 "contributors": contributors,
                 "languages": languages,
-                "commit_activity": commit_activity,
             }
             
+            # Get commit activity for last 30 days
+            if include_commit_activity:
+                overview["commit_activity"] = self.get_commit_activity(repo_name, days=30)
+            
             self._save_to_cache(cache_key, overview)
             return overview
         except Exception as e:
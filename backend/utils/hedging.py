@@ -0,0 +1,106 @@
+import concurrent.futures
+import os
+import threading
+from collections import deque
+from time import monotonic
+from utils import deadline
+
+
+class HedgedRequests:
+    """
+    Runs idempotent requests with hedging.
+
+    Each call is sent once; if it hasn't finished after the observed latency
+    percentile, an identical request is sent and whichever finishes first
+    wins. Waiting is bounded by the current request deadline.
+    """
+
+    def __init__(self, percentile=None, min_samples=20, default_delay=1.0, window=500, max_workers=None):
+        """
+        Initialize the hedging helper.
+
+        Args:
+            percentile (float): Latency percentile after which a duplicate request is sent
+            min_samples (int): Samples needed before the percentile is trusted
+            default_delay (float): Seconds to wait before hedging until enough samples exist
+            window (int): Number of recent latencies kept
+            max_workers (int): Threads running requests
+        """
+        if percentile is None:
+            percentile = float(os.environ.get('HEDGE_PERCENTILE', 95))
+        if max_workers is None:
+            max_workers = int(os.environ.get('HEDGE_WORKERS', 32))
+
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.default_delay = default_delay
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hedged-request"
+        )
+
+    def _record(self, latency):
+        with self._lock:
+            self._latencies.append(latency)
+
+    def hedge_delay(self):
+        """
+        Get how long to wait for a request before hedging it.
+
+        Returns:
+            float: Seconds
+        """
+        with self._lock:
+            samples = sorted(self._latencies)
+        if len(samples) < self.min_samples:
+            return self.default_delay
+        index = min(len(samples) - 1, int(len(samples) * self.percentile / 100))
+        return samples[index]
+
+    def _timed(self, fn, *args, **kwargs):
+        start = monotonic()
+        result = fn(*args, **kwargs)
+        self._record(monotonic() - start)
+        return result
+
+    def call(self, fn, *args, **kwargs):
+        """
+        Run an idempotent request, hedging it if it is slow.
+
+        Returns:
+            The result of the first request to succeed
+
+        Raises:
+            DeadlineExceeded: If no request finished before the deadline
+        """
+        deadline.check()
+        futures = [deadline.submit(self._executor, self._timed, fn, *args, **kwargs)]
+
+        wait_time = self.hedge_delay()
+        time_left = deadline.remaining()
+        if time_left is not None:
+            wait_time = min(wait_time, time_left)
+        done, _ = concurrent.futures.wait(futures, timeout=wait_time)
+
+        if not done:
+            deadline.check()
+            futures.append(deadline.submit(self._executor, self._timed, fn, *args, **kwargs))
+
+        error = None
+        while futures:
+            done, _ = concurrent.futures.wait(
+                futures, timeout=deadline.remaining(), return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            if not done:
+                raise deadline.DeadlineExceeded("Request deadline exceeded")
+            for future in done:
+                futures.remove(future)
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+        raise error
+
+
+# Default hedging instance for GitHub GET requests
+hedged_requests = HedgedRequests()
@@ -0,0 +1,316 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from utils.deadline import find_cause
+from utils.circuit_breaker import CircuitOpenError
+from utils.executor import ExecutorBusyError
+from utils.github_api import RateLimitError
+
+# Analysis sections run for every job, in order
+SECTIONS = ("overview", "commits", "issues", "languages")
+
+
+class JobQueue:
+    """
+    Persistent queue of repository analysis jobs.
+
+    Jobs are stored in a local SQLite database and processed by a fixed
+    number of background worker threads, so slow analyses don't hold up
+    request-serving capacity. Identical pending jobs are deduplicated, and
+    jobs that hit the GitHub rate limit or a full executor are retried later.
+    """
+
+    def __init__(self, path=None, max_workers=None, max_attempts=3, poll_interval=1.0,
+                 heartbeat_interval=30.0, stale_after=300.0, retention_hours=None):
+        """
+        Initialize the job queue.
+
+        Args:
+            path (str): SQLite database path
+            max_workers (int): Number of worker threads
+            max_attempts (int): Maximum number of runs per job before it fails
+            poll_interval (float): Seconds between polls for runnable jobs
+            heartbeat_interval (float): Seconds between heartbeats of a running job
+            stale_after (float): Seconds without a heartbeat after which a running job is reclaimed
+            retention_hours (float): How long finished jobs are kept
+        """
+        if path is None:
+            path = os.environ.get('JOB_QUEUE_PATH')
+        if not path:
+            path = os.path.join(tempfile.gettempdir(), 'repo_analyzer_jobs.sqlite3')
+        if max_workers is None:
+            max_workers = int(os.environ.get('JOB_WORKERS', 2))
+        if retention_hours is None:
+            retention_hours = float(os.environ.get('JOB_RETENTION_HOURS', 24))
+
+        self.path = path
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after
+        self.retention_seconds = retention_hours * 3600
+        self._last_purge = 0
+        self._local = threading.local()
+        self._wakeup = threading.Event()
+        self._start_lock = threading.Lock()
+        self._workers = []
+        self._pid = None
+        self._schema_ready = False
+
+    def _connection(self):
+        """
+        Get a connection for the current thread, reopening it after a fork.
+
+        The database and its schema are created on first use rather than at import.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+
+        if not self._schema_ready:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id TEXT PRIMARY KEY, repo_name TEXT NOT NULL, status TEXT NOT NULL, "
+                "progress TEXT NOT NULL, result TEXT, error TEXT, "
+                "attempts INTEGER NOT NULL DEFAULT 0, run_after REAL NOT NULL, "
+                "created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, run_after)"
+            )
+            self._schema_ready = True
+        return conn
+
+    def start(self):
+        """
+        Start the worker threads for this process.
+
+        Safe to call repeatedly; workers are started once per process.
+        """
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._workers = []
+            for index in range(self.max_workers):
+                worker = threading.Thread(
+                    target=self._work, name=f"analysis-job-{index}", daemon=True
+                )
+                worker.start()
+                self._workers.append(worker)
+
+    def enqueue(self, repo_name):
+        """
+        Enqueue an analysis job, reusing an identical pending job if one exists.
+
+        Args:
+            repo_name (str): Repository name in format "owner/repo"
+
+        Returns:
+            str: Job id
+        """
+        conn = self._connection()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE repo_name = ? AND status IN ('queued', 'running') "
+                "ORDER BY created_at LIMIT 1",
+                (repo_name,)
+            ).fetchone()
+            if row:
+                job_id = row[0]
+            else:
+                job_id = uuid.uuid4().hex
+                progress = {section: "pending" for section in SECTIONS}
+                conn.execute(
+                    "INSERT INTO jobs (id, repo_name, status, progress, run_after, created_at, updated_at) "
+                    "VALUES (?, ?, 'queued', ?, ?, ?, ?)",
+                    (job_id, repo_name, json.dumps(progress), now, now, now)
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        self._wakeup.set()
+        return job_id
+
+    def get(self, job_id):
+        """
+        Get the status of a job.
+
+        Args:
+            job_id (str): Job id
+
+        Returns:
+            dict: Job status, or None if the job doesn't exist
+        """
+        row = self._connection().execute(
+            "SELECT id, repo_name, status, progress, result, error, attempts, run_after, "
+            "created_at, updated_at FROM jobs WHERE id = ?",
+            (job_id,)
+        ).fetchone()
+        if not row:
+            return None
+
+        job = {
+            "job_id": row[0],
+            "repo_name": row[1],
+            "status": row[2],
+            "progress": json.loads(row[3]),
+            "attempts": row[6],
+            "created_at": row[8],
+            "updated_at": row[9],
+        }
+        if row[4] is not None:
+            job["result"] = json.loads(row[4])
+        if row[5] is not None:
+            job["error"] = row[5]
+        if row[2] == "queued" and row[7] > time.time():
+            job["retry_at"] = row[7]
+        return job
+
+    def _claim(self):
+        """Atomically claim the next runnable job, returning (id, repo_name) or None."""
+        conn = self._connection()
+        now = time.time()
+        stale_before = now - self.stale_after
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Finished jobs are deleted after the retention period, checked once a minute
+            if now - self._last_purge >= 60:
+                conn.execute(
+                    "DELETE FROM jobs WHERE status IN ('done', 'failed') AND updated_at <= ?",
+                    (now - self.retention_seconds,)
+                )
+                self._last_purge = now
+
+            # A job whose worker stopped sending heartbeats (e.g. the process died or the
+            # job crashed it) counts that run as an attempt and fails after the last one
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', error = ?, updated_at = ? "
+                "WHERE status = 'running' AND updated_at <= ? AND attempts >= ?",
+                ("Job was abandoned by its worker too many times", now, stale_before, self.max_attempts)
+            )
+            row = conn.execute(
+                "SELECT id, repo_name FROM jobs WHERE (status = 'queued' AND run_after <= ?) "
+                "OR (status = 'running' AND updated_at <= ?) ORDER BY created_at LIMIT 1",
+                (now, stale_before)
+            ).fetchone()
+            if row:
+                conn.execute(
+                    "UPDATE jobs SET status = 'running', attempts = attempts + 1, updated_at = ? "
+                    "WHERE id = ?",
+                    (now, row[0])
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return row
+
+    def _heartbeat(self, job_id, stop):
+        """Keep a running job's updated_at fresh until ``stop`` is set, so it isn't reclaimed."""
+        while not stop.wait(self.heartbeat_interval):
+            try:
+                self._update(job_id)
+            except sqlite3.Error as e:
+                print(f"Job queue heartbeat error: {e}")
+
+    def _update(self, job_id, **fields):
+        """Update columns of a job row."""
+        fields["updated_at"] = time.time()
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        self._connection().execute(
+            f"UPDATE jobs SET {assignments} WHERE id = ?",
+            tuple(fields.values()) + (job_id,)
+        )
+
+    def _work(self):
+        """Worker thread loop."""
+        while True:
+            try:
+                job = self._claim()
+            except sqlite3.Error as e:
+                print(f"Job queue claim error: {e}")
+                job = None
+
+            if job is None:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+                continue
+
+            stop = threading.Event()
+            heartbeat = threading.Thread(
+                target=self._heartbeat, args=(job[0], stop), name="analysis-job-heartbeat", daemon=True
+            )
+            heartbeat.start()
+            try:
+                self._run(*job)
+            finally:
+                stop.set()
+
+    def _run(self, job_id, repo_name):
+        """Run all analysis sections for a job and record the outcome."""
+        from models.repository import Repository
+
+        start_time = time.time()
+        progress = {section: "pending" for section in SECTIONS}
+        result = {}
+
+        try:
+            repo = Repository(repo_name)
+            section_methods = {
+                "overview": repo.fetch_data,
+                "commits": repo.get_commit_trends,
+                "issues": repo.get_issue_metrics,
+                "languages": repo.get_language_analysis,
+            }
+
+            for section in SECTIONS:
+                progress[section] = "running"
+                self._update(job_id, progress=json.dumps(progress))
+                result[section] = section_methods[section]()
+                progress[section] = "done"
+                self._update(job_id, progress=json.dumps(progress))
+
+            result["analysis_time"] = round(time.time() - start_time, 2)
+            self._update(job_id, status="done", progress=json.dumps(progress),
+                         result=json.dumps(result, default=str), error=None)
+        except Exception as e:
+            for section, state in progress.items():
+                if state == "running":
+                    progress[section] = "failed"
+
+            attempts = self._connection().execute(
+                "SELECT attempts FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()[0]
+            retry_at = None
+            retry_error = find_cause(e, RateLimitError) or find_cause(e, CircuitOpenError)
+            if retry_error is not None:
+                retry_at = retry_error.reset_time or 0
+            busy_error = find_cause(e, ExecutorBusyError)
+            if busy_error is not None:
+                retry_at = time.time() + busy_error.retry_after
+
+            if retry_at is not None and attempts < self.max_attempts:
+                # Completed sections are cached, so the retry only redoes the rest
+                run_after = max(time.time(), retry_at) + 5
+                self._update(job_id, status="queued", progress=json.dumps(progress),
+                             error=str(e), run_after=run_after)
+            else:
+                self._update(job_id, status="failed", progress=json.dumps(progress),
+                             error=str(e))
+
+
+# Default job queue instance
+job_queue = JobQueue()
@@ -0,0 +1,60 @@
+import base64
+
+
+def encode_cursor(offset):
+    """
+    Encode a list offset as an opaque cursor.
+
+    Args:
+        offset (int): Index of the first item of the next page
+
+    Returns:
+        str: Cursor
+    """
+    return base64.urlsafe_b64encode(f"offset:{offset}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor (str): Cursor, or None for the first page
+
+    Returns:
+        int: Offset of the first item of the page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return 0
+    try:
+        decoded = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        prefix, offset = decoded.split(":", 1)
+        if prefix != "offset" or int(offset) < 0:
+            raise ValueError
+        return int(offset)
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+def paginate(items, cursor=None, limit=None):
+    """
+    Get one page of a list.
+
+    Args:
+        items (list): Full list
+        cursor (str): Cursor returned with the previous page, or None for the first page
+        limit (int): Page size, or None for everything from the cursor on
+
+    Returns:
+        tuple: (page items, cursor for the next page or None if this is the last page)
+    """
+    offset = decode_cursor(cursor)
+    if limit is None:
+        return items[offset:], None
+
+    end = offset + max(1, limit)
+    next_cursor = encode_cursor(end) if end < len(items) else None
+    return items[offset:end], next_cursor
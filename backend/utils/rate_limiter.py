@@ -0,0 +1,144 @@
+import os
+import sqlite3
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket for a request budget per minute.
+
+    Tokens refill continuously up to one minute's worth. Callers that get no
+    token skip the request rather than wait, so they never hold a request
+    thread and can fill the gap on a later call.
+
+    With the shared cache backend, the bucket lives in the shared cache's
+    SQLite file, so all worker processes on the host draw from one budget.
+    Otherwise it is kept in this process.
+    """
+
+    def __init__(self, name, per_minute, path=None):
+        """
+        Initialize the limiter with a full bucket.
+
+        Args:
+            name (str): Bucket name, unique within the shared file
+            per_minute (int): Requests allowed per minute
+            path (str): SQLite file holding the bucket, "" to keep it in this
+                process, or None to use the shared cache's file if it is enabled
+        """
+        self.name = name
+        self.per_minute = max(1, per_minute)
+        self.path = path
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._tokens = float(self.per_minute)
+        self._updated_at = time.time()
+
+    def _shared_path(self):
+        """Get the SQLite file of the bucket, or "" if it is kept in this process."""
+        if self.path is None:
+            from utils.cache import SharedMemoryCache, cache
+            provider = cache.init()
+            self.path = provider.path if isinstance(provider, SharedMemoryCache) else ""
+        return self.path
+
+    def _connection(self, path):
+        """Get a connection for the current thread, reopening it after a fork."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits ("
+                "name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _refill(self, tokens, updated_at, now):
+        """Get the token count after refilling since ``updated_at``."""
+        return min(self.per_minute, tokens + max(0.0, now - updated_at) * self.per_minute / 60)
+
+    def _change(self, change):
+        """
+        Atomically apply ``change`` to the refilled token count.
+
+        Args:
+            change (callable): Takes the token count and returns (new token count, result)
+
+        Returns:
+            The result returned by ``change``
+        """
+        path = self._shared_path()
+        if path:
+            try:
+                return self._change_shared(path, change)
+            except sqlite3.Error as e:
+                print(f"Shared rate limiter error, using this process's budget: {e}")
+
+        with self._lock:
+            now = time.time()
+            self._tokens, result = change(self._refill(self._tokens, self._updated_at, now))
+            self._updated_at = now
+            return result
+
+    def _change_shared(self, path, change):
+        """Apply ``change`` to the bucket stored in the shared SQLite file."""
+        conn = self._connection(path)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM rate_limits WHERE name = ?", (self.name,)
+            ).fetchone()
+            tokens = self._refill(*row, now) if row else float(self.per_minute)
+            tokens, result = change(tokens)
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limits (name, tokens, updated_at) VALUES (?, ?, ?)",
+                (self.name, tokens, now)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return result
+
+    def try_acquire(self, count=1):
+        """
+        Take ``count`` tokens if they are all available.
+
+        Args:
+            count (int): Number of requests to make
+
+        Returns:
+            bool: Whether the requests may be made now
+        """
+        def take(tokens):
+            if tokens < count:
+                return tokens, False
+            return tokens - count, True
+        return self._change(take)
+
+    def release(self, count=1):
+        """
+        Return tokens for requests that were never sent.
+
+        Args:
+            count (int): Number of tokens to return
+        """
+        self._change(lambda tokens: (min(self.per_minute, tokens + count), None))
+
+    def available(self):
+        """
+        Get the number of whole tokens available.
+
+        Returns:
+            int: Requests that may be made now
+        """
+        return self._change(lambda tokens: (tokens, int(tokens)))
+
+
+# GitHub allows 30 search requests per minute per token
+search_rate_limiter = RateLimiter("github_search", int(os.environ.get('SEARCH_REQUESTS_PER_MINUTE', 30)))
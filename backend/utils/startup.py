@@ -0,0 +1,96 @@
+import os
+import threading
+from time import time
+
+
+class AppStartup:
+    """
+    One-time application startup work and readiness tracking.
+
+    Heavy imports, cache setup, GitHub client creation and the job workers
+    are started in a background thread, so the app can answer liveness
+    checks right away and report readiness once the work is done.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self.ready = False
+        self.error = None
+        self.startup_time = None
+
+    def start(self, start_jobs=True):
+        """
+        Start the startup work in the background for this process.
+
+        Safe to call repeatedly; it runs once per process, and again after a failure.
+
+        Args:
+            start_jobs (bool): Whether to start the analysis job workers in this process
+        """
+        with self._lock:
+            if self._pid == os.getpid() and (self.ready or self._thread.is_alive()):
+                return
+            self._pid = os.getpid()
+            self.ready = False
+            self.error = None
+            self._thread = threading.Thread(
+                target=self._run, args=(start_jobs,), name="app-startup", daemon=True
+            )
+            self._thread.start()
+
+    def wait(self, timeout=None):
+        """
+        Block until the startup work of this process has finished.
+
+        Args:
+            timeout (float): Maximum number of seconds to wait
+
+        Returns:
+            bool: Whether the app is ready
+        """
+        thread = self._thread
+        if thread is not None and self._pid == os.getpid():
+            thread.join(timeout)
+        return self.ready
+
+    def _run(self, start_jobs):
+        """Run the startup steps and record the outcome."""
+        from utils.cache import cache
+        from utils.github_api import GitHubAnalyzer, load_dependencies
+        from utils.job_queue import job_queue
+
+        start_time = time()
+        try:
+            cache.init()
+            load_dependencies()
+
+            token = os.environ.get("GITHUB_TOKEN")
+            if token:
+                GitHubAnalyzer.get_client(token)
+
+            if start_jobs:
+                job_queue.start()
+            self.startup_time = round(time() - start_time, 2)
+            self.ready = True
+        except Exception as e:
+            self.error = str(e)
+            print(f"Application startup failed: {e}")
+
+    def status(self):
+        """
+        Get the readiness status.
+
+        Returns:
+            dict: Readiness status
+        """
+        if self.ready:
+            return {"status": "ready", "startup_time": self.startup_time}
+        if self.error:
+            return {"status": "error", "error": self.error}
+        return {"status": "starting"}
+
+
+# Default startup instance
+startup = AppStartup()
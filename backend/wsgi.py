@@ -0,0 +1,11 @@
+import os
+import sys
+
+# Add the current directory to the path so Python can find the modules
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from app import create_app
+
+# WSGI entry point for production servers, e.g. `gunicorn -c gunicorn.conf.py wsgi:app`.
+# FLASK_ENV is not used here because .env sets it to development for `python app.py`.
+app = create_app(os.environ.get('APP_CONFIG', 'production'))